@@ -1,6 +1,7 @@
 import QtQuick 2.15
 import QtQuick.Window 2.15
 import QtQuick.Layouts 1.15
+import ControlHead 1.0
 
 Window {
     id: root
@@ -208,12 +209,12 @@ Window {
 
     // Hardware → navigation mapping
     Connections {
-        target: Bridge
-        function onPicoButton(name, pressed) {
+        target: Serial
+        function onButtonEvent(name, pressed) {
             if (!pressed)
                 return;
 
-            LogBridge.log("info", "QML.Bridge.onPicoButton", "PicoButton: " + name + " pressed");
+            LogBridge.log("info", "QML.Serial.onButtonEvent", "PicoButton: " + name + " pressed");
 
             switch (name) {
             case "COMPUTER":      // your Home key
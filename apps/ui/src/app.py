@@ -1,10 +1,13 @@
 # src/app.py
 from __future__ import annotations
 import sys
+import functools
+from contextlib import contextmanager
 from pathlib import Path
-from PySide6.QtCore import QUrl, QObject, Slot, Signal, Qt, QSize
+from typing import Callable
+from PySide6.QtCore import QUrl, QObject, Slot, Signal, Qt, QSize, QFile, QTimer
 from PySide6.QtGui import QGuiApplication
-from PySide6.QtQml import QQmlApplicationEngine
+from PySide6.QtQml import QQmlApplicationEngine, qmlRegisterSingletonInstance
 from .serial_worker import SerialWorker
 import signal
 import platform
@@ -15,72 +18,84 @@ from switches import SwitchManager, SwitchType, LogicalSwitch
 from pcm import PCMManager, CanInterface
 
 
-root_logger = setup_logging()
 logger = logging.getLogger("control_head.app")
+qml_logger = logging.getLogger("control_head")  # QmlLogBridge records
+
+# QML level name (upper-cased) -> logging level; anything else logs at INFO
+_QML_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 APP_DIR = Path(__file__).resolve().parents[1]
 QML_DIR = APP_DIR / "qml"
+_IS_LINUX = platform.system() == "Linux"  # Pi kiosk vs. desktop dev window
 
-# --- hardware / logical layer ---
-pcm_mgr = PCMManager(CanInterface)
-front_pcm = pcm_mgr.add_pcm(node_id=1, name="Front PCM")
-rear_pcm  = pcm_mgr.add_pcm(node_id=2, name="Rear PCM")
-
-# Define channels by what they actually go to
-front_light_left  = front_pcm.init_channel(0, label="Front Light Left")
-front_light_right = front_pcm.init_channel(1, label="Front Light Right")
-grill_light       = front_pcm.init_channel(2, label="Grill Light")
-horn_ch = front_pcm.init_channel(3, label="Horn")
-switches = SwitchManager()
-
-Front_lights = switches.add(
-    LogicalSwitch(
-        name="Front Lights",
-        type=SwitchType.CYCLE,
-        channels=[front_light_left, front_light_right, grill_light],
-        cycles=[
-            [],
-            [front_light_left],
-            [front_light_left, front_light_right],
-            [front_light_left, front_light_right, grill_light],
-        ],
-    )
-)
+QML_URI = "ControlHead"
+MAIN_QML_RESOURCE = ":/Main.qml"
+MAIN_QML_URL = QUrl("qrc:/Main.qml")
+MAIN_QML_FILE_URL = QUrl.fromLocalFile(str(QML_DIR / "Main.qml"))
+FIXED_SIZE = QSize(800, 480)  # non-Linux dev window
 
-Horn = switches.add(
-    LogicalSwitch(
-        name="Horn",
-        type=SwitchType.MOMENTARY,
-        channels=[horn_ch],
-    )
-)
+# Shared, read-only `extra` dicts so log calls don't allocate a new one
+# each time. logging only reads from `extra`.
+_ORIGIN_UNKNOWN_SWITCH = {"origin": "app.Bridge._unknown_switch"}
+_ORIGIN_SET_SWITCH_STATE = {"origin": "app.Bridge.setSwitchState"}
+_ORIGIN_TOGGLE_SWITCH = {"origin": "app.Bridge.toggleSwitch"}
+_ORIGIN_PRESS_SWITCH = {"origin": "app.Bridge.pressSwitch"}
+_ORIGIN_SET_SWITCH_STATES = {"origin": "app.Bridge.setSwitchStates"}
+_ORIGIN_PRESS_SWITCHES = {"origin": "app.Bridge.pressSwitches"}
+_ORIGIN_RELEASE_SWITCH = {"origin": "app.Bridge.releaseSwitch"}
+_ORIGIN_PICO_BUTTON = {"origin": "app.Bridge.handlePicoButton"}
+_ORIGIN_MAKE_ENGINE = {"origin": "app.make_engine"}
+_ORIGIN_MAIN = {"origin": "app.main"}
+
+
+def _noop() -> None:
+    pass
 
 
+@functools.lru_cache(maxsize=64)
+def _origin_extra(origin: str) -> dict:
+    # QML origins come from a small fixed set of call sites
+    return {"origin": origin}
 
 
 class QmlLogBridge(QObject):
-    logAdded = Signal(str, str, str)  # level, origin, message
+    # [[level, origin, message], ...] -- everything logged since the last
+    # flush (at most every ~2 frames), so a log view does one model append
+    # per flush instead of one JS round-trip per line.
+    logsAdded = Signal("QVariantList")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: list[list[str]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush)
 
     @Slot(str, str, str)
     def log(self, level, origin, message):
         level = level.upper()
-        logger_ = logging.getLogger("control_head")
-        extra = {"origin": origin}
-
-        if level == "DEBUG":
-            logger_.debug(message, extra=extra)
-        elif level == "INFO":
-            logger_.info(message, extra=extra)
-        elif level == "WARNING":
-            logger_.warning(message, extra=extra)
-        elif level == "ERROR":
-            logger_.error(message, extra=extra)
-        elif level == "CRITICAL":
-            logger_.critical(message, extra=extra)
-        else:
-            logger_.info(message, extra=extra)
+        levelno = _QML_LEVELS.get(level, logging.INFO)
+        if qml_logger.isEnabledFor(levelno):
+            qml_logger.log(levelno, message, extra=_origin_extra(origin))
+
+        self._pending.append([level, origin, message])
+        # Not restarted on each call, so a steady stream still flushes
+        # every interval instead of being held back indefinitely.
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        self.logsAdded.emit(pending)
 
-        self.logAdded.emit(level, origin, message)
 
 class Bridge(QObject):
     """
@@ -90,8 +105,12 @@ class Bridge(QObject):
       - SerialWorker (hardware button events)
     """
 
-    # Emitted so QML can react to hardware button events if desired
-    picoButton = Signal(str, bool)
+    # name, is_on (commanded state) -- after a single switch is changed
+    # through the Bridge
+    switchStateChanged = Signal(str, bool)
+    # {name: is_on} -- once at the end of a batch, in place of the
+    # individual switchStateChanged emissions
+    switchesChanged = Signal("QVariantMap")
 
     def __init__(self, switches: SwitchManager, parent=None):
         super().__init__(parent)
@@ -103,33 +122,108 @@ class Bridge(QObject):
             "HORN": "Horn",
         }
 
+        self._batch_depth = 0
+        self._pending_states: dict[str, bool] = {}
+
+        # Bound-method tables built once from the registered switches, so
+        # each slot is a dict lookup plus one call instead of a name lookup
+        # and hasattr probes per event.
+        self._on: dict[str, Callable[[], None]] = {}
+        self._off: dict[str, Callable[[], None]] = {}
+        self._toggle: dict[str, Callable[[], None]] = {}
+        self._press: dict[str, Callable[[], None]] = {}
+        self._release: dict[str, Callable[[], None]] = {}
+        # name -> commanded (requested) on/off, reported back to QML
+        self._is_on: dict[str, Callable[[], bool]] = {}
+        for name, sw in switches.items():
+            self._add_switch(name, sw)
+
+        # physical button -> (press_fn, release_fn, logical_name), so a
+        # serial event is a single lookup plus a tuple index
+        self._pico_handlers: dict[str, tuple[Callable[[], None], Callable[[], None], str]] = {}
+        for button_name, logical_name in self._button_map.items():
+            if logical_name not in self._press:
+                self._unknown_switch(logical_name)
+                continue
+            self._pico_handlers[button_name] = (
+                self._press[logical_name],
+                self._release[logical_name],
+                logical_name,
+            )
+
     # ---------- internals ----------
 
-    def _get_switch(self, name: str):
+    def _add_switch(self, name: str, sw: LogicalSwitch) -> None:
+        """
+        Fill the dispatch tables for one switch, probing optional
+        capabilities (toggle/press/release) here rather than per call.
         """
-        Helper to fetch a LogicalSwitch by name from SwitchManager.
-        Works whether SwitchManager is a dict-like or has a .get() method.
+        # Commands only change requested state; the PCM's reported state
+        # lags (or never arrives without CAN RX), so report what was asked for.
+        is_on = getattr(sw, "is_requested_on", sw.is_on)
+        toggle = getattr(sw, "toggle", None)
+        if toggle is None:
+            def toggle(sw=sw, is_on=is_on):
+                if is_on():
+                    sw.off()
+                else:
+                    sw.on()
+
+        self._on[name] = sw.on
+        self._off[name] = sw.off
+        self._toggle[name] = toggle
+        # Reasonable fallback for press: just toggle
+        self._press[name] = getattr(sw, "press", toggle)
+        self._release[name] = getattr(sw, "release", _noop)
+        self._is_on[name] = is_on
+
+    def _notify(self, name: str) -> None:
         """
-        sw = None
+        Report a switch's new state to QML, or hold it for the end of the
+        current batch.
+        """
+        on = self._is_on[name]()
+        if self._batch_depth:
+            self._pending_states[name] = on
+        else:
+            self.switchStateChanged.emit(name, on)
 
-        # SwitchManager with .get(name)
-        if hasattr(self._switches, "get"):
-            try:
-                sw = self._switches.get(name)
-            except TypeError:
-                # In case .get has a different signature
-                sw = None
+    # ---------- batching ----------
 
-        # Or SwitchManager *is* a dict-like
-        if sw is None and isinstance(self._switches, dict):
-            sw = self._switches.get(name)
+    @Slot()
+    def beginBatch(self) -> None:
+        """
+        Start collecting switch state changes; nested calls are allowed.
+        """
+        self._batch_depth += 1
 
-        if sw is None:
-            logger.warning(
-                f"Unknown switch '{name}'",
-                extra={"origin": "app.Bridge._get_switch"},
-            )
-        return sw
+    @Slot()
+    def endBatch(self) -> None:
+        """
+        Close a batch; the outermost one emits a single switchesChanged.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._pending_states:
+            pending, self._pending_states = self._pending_states, {}
+            self.switchesChanged.emit(pending)
+
+    @contextmanager
+    def batch(self):
+        """
+        Python-side `with bridge.batch():` around beginBatch()/endBatch().
+        """
+        self.beginBatch()
+        try:
+            yield self
+        finally:
+            self.endBatch()
+
+    def _unknown_switch(self, name: str) -> None:
+        logger.warning(
+            "Unknown switch '%s'",
+            name,
+            extra=_ORIGIN_UNKNOWN_SWITCH,
+        )
 
     # ---------- QML → Logic ----------
 
@@ -139,18 +233,17 @@ class Bridge(QObject):
         Directly set a logical switch ON/OFF from QML.
         """
         logger.info(
-            f"QML setSwitchState: {name} -> {on}",
-            extra={"origin": "app.Bridge.setSwitchState"},
+            "QML setSwitchState: %s -> %s",
+            name,
+            on,
+            extra=_ORIGIN_SET_SWITCH_STATE,
         )
-        sw = self._get_switch(name)
-        if sw is None:
+        fn = (self._on if on else self._off).get(name)
+        if fn is None:
+            self._unknown_switch(name)
             return
-
-        if on:
-            sw.on()
-        else:
-            sw.off()
-    
+        fn()
+        self._notify(name)
 
     @Slot(str)
     def toggleSwitch(self, name: str) -> None:
@@ -158,20 +251,16 @@ class Bridge(QObject):
         Toggle a logical switch from QML.
         """
         logger.info(
-            f"QML toggleSwitch: {name}",
-            extra={"origin": "app.Bridge.toggleSwitch"},
+            "QML toggleSwitch: %s",
+            name,
+            extra=_ORIGIN_TOGGLE_SWITCH,
         )
-        sw = self._get_switch(name)
-        if sw is None:
+        fn = self._toggle.get(name)
+        if fn is None:
+            self._unknown_switch(name)
             return
-
-        try:
-            sw.toggle()
-        except AttributeError:
-            logger.error(
-                f"Switch '{name}' has no toggle(); add it to LogicalSwitch",
-                extra={"origin": "app.Bridge.toggleSwitch"},
-            )
+        fn()
+        self._notify(name)
 
     @Slot(str)
     def pressSwitch(self, name: str) -> None:
@@ -181,18 +270,16 @@ class Bridge(QObject):
         TOGGLE / MOMENTARY / CYCLE behavior.
         """
         logger.info(
-            f"QML pressSwitch: {name}",
-            extra={"origin": "app.Bridge.pressSwitch"},
+            "QML pressSwitch: %s",
+            name,
+            extra=_ORIGIN_PRESS_SWITCH,
         )
-        sw = self._get_switch(name)
-        if sw is None:
+        fn = self._press.get(name)
+        if fn is None:
+            self._unknown_switch(name)
             return
-
-        if hasattr(sw, "press"):
-            sw.press()
-        else:
-            # Reasonable fallback: just toggle
-            self.toggleSwitch(name)
+        fn()
+        self._notify(name)
 
     @Slot(str)
     def releaseSwitch(self, name: str) -> None:
@@ -201,118 +288,241 @@ class Bridge(QObject):
         Typically mapped to LogicalSwitch.release() for momentary behavior.
         """
         logger.info(
-            f"QML releaseSwitch: {name}",
-            extra={"origin": "app.Bridge.releaseSwitch"},
+            "QML releaseSwitch: %s",
+            name,
+            extra=_ORIGIN_RELEASE_SWITCH,
         )
-        sw = self._get_switch(name)
-        if sw is None:
+        fn = self._release.get(name)
+        if fn is None:
+            self._unknown_switch(name)
             return
+        fn()
+        self._notify(name)
 
-        if hasattr(sw, "release"):
-            sw.release()
+    @Slot("QVariantList")
+    def setSwitchStates(self, items) -> None:
+        """
+        Batched setSwitchState for QML: `items` is a JS array of
+        [name, on] pairs, applied in one Python call instead of one
+        binding crossing per switch.
+        """
+        logger.info(
+            "QML setSwitchStates: %d switches",
+            len(items),
+            extra=_ORIGIN_SET_SWITCH_STATES,
+        )
+        on_fns = self._on
+        off_fns = self._off
+        with self.batch():
+            for name, on in items:
+                fn = (on_fns if on else off_fns).get(name)
+                if fn is None:
+                    self._unknown_switch(name)
+                    continue
+                fn()
+                self._notify(name)
+
+    @Slot("QVariantList")
+    def pressSwitches(self, names) -> None:
+        """
+        Batched pressSwitch for QML: press every switch in `names`.
+        """
+        logger.info(
+            "QML pressSwitches: %d switches",
+            len(names),
+            extra=_ORIGIN_PRESS_SWITCHES,
+        )
+        press_fns = self._press
+        with self.batch():
+            for name in names:
+                fn = press_fns.get(name)
+                if fn is None:
+                    self._unknown_switch(name)
+                    continue
+                fn()
+                self._notify(name)
 
     # ---------- Serial / physical buttons → Logic (+QML) ----------
 
     @Slot(str, bool)
     def handlePicoButton(self, button_name: str, pressed: bool) -> None:
         """
-        Optional: called when SerialWorker reports a hardware button event.
+        Called when SerialWorker reports a hardware button event.
 
-        You can leave this unused for now; it doesn't affect QML behavior.
+        Only drives the logical switch layer; QML navigation listens to
+        SerialWorker.buttonEvent directly (QML singleton "Serial").
         """
         logger.info(
-            f"Pico button event: {button_name} -> {pressed}",
-            extra={"origin": "app.Bridge.handlePicoButton"},
+            "Pico button event: %s -> %s",
+            button_name,
+            pressed,
+            extra=_ORIGIN_PICO_BUTTON,
         )
 
-        # Re-emit to QML if UI wants to listen (optional)
-        self.picoButton.emit(button_name, pressed)
-
-        logical_name = self._button_map.get(button_name)
-        if logical_name is None:
+        handlers = self._pico_handlers.get(button_name)
+        if handlers is None:
             logger.warning(
-                f"Unmapped button '{button_name}'",
-                extra={"origin": "app.Bridge.handlePicoButton"},
+                "Unmapped button '%s'",
+                button_name,
+                extra=_ORIGIN_PICO_BUTTON,
             )
             return
 
-        sw = self._get_switch(logical_name)
-        if sw is None:
-            return
+        handlers[0 if pressed else 1]()
+        self._notify(handlers[2])
 
-        if pressed:
-            if hasattr(sw, "press"):
-                sw.press()
-            else:
-                sw.toggle()
-        else:
-            if hasattr(sw, "release"):
-                sw.release()
+    @Slot(list)
+    def handlePicoButtons(self, events: list) -> None:
+        """
+        Batched form of handlePicoButton: SerialWorker.buttonEvents delivers
+        every (button_name, pressed) pair from one serial read burst at once.
+        """
+        with self.batch():
+            for button_name, pressed in events:
+                self.handlePicoButton(button_name, pressed)
 
 
-def make_engine(switches: SwitchManager) -> tuple[QQmlApplicationEngine, Bridge, SerialWorker]:
-    logger.info("Setting up QML engine and Bridge", extra={"origin": "app.make_engine"})
-    engine = QQmlApplicationEngine()
+def make_engine(
+    switches: SwitchManager,
+) -> tuple[QQmlApplicationEngine, Bridge, SerialWorker, QmlLogBridge]:
+    logger.info("Setting up QML engine and Bridge", extra=_ORIGIN_MAKE_ENGINE)
 
     bridge = Bridge(switches)
-    engine.rootContext().setContextProperty("Bridge", bridge)
+
+    # Log bridge for QML log view
+    log_bridge = QmlLogBridge()
 
     serial = SerialWorker(
         port=None,
         baud=115200,
     )
 
-    logger.info("Starting SerialWorker thread", extra={"origin": "app.make_engine"})
+    # Expose the Python objects as QML singletons (`import ControlHead 1.0`)
+    # rather than context properties: the QML compiler resolves singleton
+    # members when a file is compiled instead of looking names up in the
+    # context chain on every call. They must be registered before the
+    # QQmlApplicationEngine is created (not merely before load()), otherwise
+    # the engine's type registry doesn't see the module and loading fails.
+    # QML also listens to SerialWorker.buttonEvent directly for navigation,
+    # so hardware events reach the UI without going through a Python slot.
+    qmlRegisterSingletonInstance(Bridge, QML_URI, 1, 0, "Bridge", bridge)
+    qmlRegisterSingletonInstance(QmlLogBridge, QML_URI, 1, 0, "LogBridge", log_bridge)
+    qmlRegisterSingletonInstance(SerialWorker, QML_URI, 1, 0, "Serial", serial)
+
+    engine = QQmlApplicationEngine()
+
+    logger.info("Starting SerialWorker thread", extra=_ORIGIN_MAKE_ENGINE)
     serial.start()
 
     # Wire SerialWorker -> Bridge
-    # expects SerialWorker.buttonEvent: Signal(str button_name, bool pressed)
-    serial.buttonEvent.connect(bridge.handlePicoButton)
-
-    engine.load(QUrl.fromLocalFile(str(QML_DIR / "Main.qml")))
+    # expects SerialWorker.buttonEvents: Signal(list[(str button_name, bool pressed)])
+    # Both objects live on the GUI thread (only the reader is moved to the
+    # serial QThread), so connect directly to the @Slot(list) and skip
+    # Qt's per-emit connection-type detection.
+    serial.buttonEvents.connect(bridge.handlePicoButtons, Qt.DirectConnection)
+
+    # Prefer the QML compiled into resources_rc (see qml/resources.qrc) so it
+    # isn't read from disk at startup; fall back to the source tree when the
+    # resource module predates the QML entries.
+    if QFile.exists(MAIN_QML_RESOURCE):
+        engine.load(MAIN_QML_URL)
+    else:
+        logger.info("Main.qml not in resources; loading from %s", QML_DIR, extra=_ORIGIN_MAKE_ENGINE)
+        engine.load(MAIN_QML_FILE_URL)
     if not engine.rootObjects():
-        logger.critical("Failed to load QML root object", extra={"origin": "app.make_engine"})
+        logger.critical("Failed to load QML root object", extra=_ORIGIN_MAKE_ENGINE)
         raise SystemExit("Failed to load QML")
 
     root = engine.rootObjects()[0]
     try:
-        if platform.system() == "Linux":
+        if _IS_LINUX:
             logger.info(
                 "Setting up Linux window flags and fullscreen",
-                extra={"origin": "app.make_engine"},
+                extra=_ORIGIN_MAKE_ENGINE,
             )
             root.setFlags(Qt.FramelessWindowHint | Qt.Window)
             root.showFullScreen()
         else:
             logger.info(
                 "Setting up Windows fixed size window",
-                extra={"origin": "app.make_engine"},
+                extra=_ORIGIN_MAKE_ENGINE,
             )
             root.setFlags(Qt.Window)
-            root.setMinimumSize(QSize(800, 480))
-            root.setMaximumSize(QSize(800, 480))
-            root.resize(800, 480)
+            root.setMinimumSize(FIXED_SIZE)
+            root.setMaximumSize(FIXED_SIZE)
+            root.resize(FIXED_SIZE)
             root.show()
     except Exception:
-        logger.exception("Error setting up window", extra={"origin": "app.make_engine"})
+        logger.exception("Error setting up window", extra=_ORIGIN_MAKE_ENGINE)
 
-    logger.info("QML engine and Bridge setup complete", extra={"origin": "app.make_engine"})
-    return engine, bridge, serial
+    logger.info("QML engine and Bridge setup complete", extra=_ORIGIN_MAKE_ENGINE)
+    return engine, bridge, serial, log_bridge
 
 
-def main() -> None:
-    logger.info("Starting Control Head UI application", extra={"origin": "app.main"})
-    app = QGuiApplication(sys.argv)
+def build_hardware() -> SwitchManager:
+    """
+    Create the PCM devices/channels and the logical switches bound to them.
+    """
+    pcm_mgr = PCMManager(CanInterface)
+    front_pcm = pcm_mgr.add_pcm(node_id=1, name="Front PCM")
+    rear_pcm  = pcm_mgr.add_pcm(node_id=2, name="Rear PCM")
+
+    # Define channels by what they actually go to
+    front_light_left  = front_pcm.init_channel(0, label="Front Light Left")
+    front_light_right = front_pcm.init_channel(1, label="Front Light Right")
+    grill_light       = front_pcm.init_channel(2, label="Grill Light")
+    horn_ch = front_pcm.init_channel(3, label="Horn")
+    switches = SwitchManager()
+
+    switches.add(
+        LogicalSwitch(
+            name="Front Lights",
+            type=SwitchType.CYCLE,
+            channels=[front_light_left, front_light_right, grill_light],
+            cycles=[
+                [],
+                [front_light_left],
+                [front_light_left, front_light_right],
+                [front_light_left, front_light_right, grill_light],
+            ],
+        )
+    )
 
-    if platform.system() == "Linux":
-        app.setOverrideCursor(Qt.BlankCursor)
+    switches.add(
+        LogicalSwitch(
+            name="Horn",
+            type=SwitchType.MOMENTARY,
+            channels=[horn_ch],
+        )
+    )
 
-    engine, bridge, serial = make_engine(switches)
+    return switches
 
-    # Log bridge for QML log view
-    log_bridge = QmlLogBridge()
-    engine.rootContext().setContextProperty("LogBridge", log_bridge)
 
-    signal.signal(signal.SIGINT, signal.SIG_DFL)
-    app.aboutToQuit.connect(lambda: None)
-    sys.exit(app.exec())
+def main() -> None:
+    log_listener = None
+    if not logging.getLogger("control_head").handlers:
+        _, log_listener = setup_logging()
+
+    # Everything after setup_logging() runs inside the try so a startup
+    # failure (e.g. "Failed to load QML") still flushes the queued records,
+    # including the one explaining it; the listener thread is a daemon.
+    try:
+        logger.info("Starting Control Head UI application", extra=_ORIGIN_MAIN)
+        app = QGuiApplication(sys.argv)
+
+        if _IS_LINUX:
+            app.setOverrideCursor(Qt.BlankCursor)
+
+        switches = build_hardware()
+        engine, bridge, serial, log_bridge = make_engine(switches)
+
+        # engine/bridge/serial/log_bridge stay referenced by these locals until
+        # app.exec() returns.
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        exit_code = app.exec()
+    finally:
+        # Flush whatever is still queued for the console/file handlers
+        if log_listener is not None:
+            log_listener.stop()
+    sys.exit(exit_code)
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Union, Iterable
+from array import array
+from typing import Dict, List, Optional, Tuple, Union, Iterable
 import logging
 import time
 
@@ -13,16 +13,18 @@ from patterns import Pattern, PatternTarget, PatternTargetType
 
 logger = logging.getLogger("control_head.effects")
 
+_ORIGIN_ENGINE_INIT = {"origin": "effects.PatternEngine.__init__"}
+_ORIGIN_START_PATTERN = {"origin": "effects.PatternEngine.start_pattern"}
+_ORIGIN_STOP_PATTERN = {"origin": "effects.PatternEngine.stop_pattern"}
+
 
 # ---------- Ownership Model ----------
 
-@dataclass
-class ChannelOwner:
-    """
-    Tracks who currently 'owns' a given channel and what state they last applied.
-    """
-    owner_id: str     # e.g. "pattern:EMERGENCY_FRONT" or "switch:FrontLights"
-    value: Union[bool, float]
+# Who currently 'owns' a given channel and what state they last applied:
+# (owner_id, value), e.g. ("pattern:EMERGENCY_FRONT", True) or
+# ("switch:FrontLights", 0.5). A plain tuple so tick() doesn't construct an
+# object per channel.
+ChannelOwner = Tuple[str, Union[bool, float]]
 
 
 # ---------- Pattern / Effects Engine ----------
@@ -45,10 +47,12 @@ class PatternEngine:
         self._switches = switch_manager
 
         self._patterns: Dict[str, Pattern] = {}         # all known
+        self._buffers: Dict[str, array] = {}            # pattern_name -> evaluate() output
+        self._owner_ids: Dict[str, str] = {}            # pattern_name -> "pattern:<name>"
         self._active: Dict[str, Pattern] = {}           # active pattern_name -> Pattern
         self._channel_owners: Dict[tuple, ChannelOwner] = {}  # (node_id, ch) -> owner
 
-        logger.info("PatternEngine created", extra={"origin": "effects.PatternEngine.__init__"})
+        logger.info("PatternEngine created", extra=_ORIGIN_ENGINE_INIT)
 
     # ----- Registration -----
 
@@ -58,6 +62,8 @@ class PatternEngine:
         Does not activate it.
         """
         self._patterns[pattern.name] = pattern
+        self._buffers[pattern.name] = array("b", bytes(len(pattern.target_keys)))
+        self._owner_ids[pattern.name] = f"pattern:{pattern.name}"
 
     # ----- Control API -----
 
@@ -68,8 +74,9 @@ class PatternEngine:
         pattern = self._patterns.get(name)
         if not pattern:
             logger.warning(
-                f"Attempted to start unknown pattern '{name}'",
-                extra={"origin": "effects.PatternEngine.start_pattern"},
+                "Attempted to start unknown pattern '%s'",
+                name,
+                extra=_ORIGIN_START_PATTERN,
             )
             return
         self._active[name] = pattern
@@ -80,12 +87,12 @@ class PatternEngine:
         """
         if name in self._active:
             del self._active[name]
-            # Channel ownership cleanup for that pattern will be handled in next tick.
-            # (Implementation detail to be filled in.)
+            # Channel ownership cleanup for that pattern is handled in the next tick.
         else:
             logger.debug(
-                f"Pattern '{name}' not active",
-                extra={"origin": "effects.PatternEngine.stop_pattern"},
+                "Pattern '%s' not active",
+                name,
+                extra=_ORIGIN_STOP_PATTERN,
             )
 
     def stop_all(self) -> None:
@@ -93,21 +100,56 @@ class PatternEngine:
         Stop all active patterns and release all pattern ownerships.
         """
         self._active.clear()
-        self._channel_owners.clear()
-        # Optionally: restore channels/switches to some default/off state.
+        # Like stop_pattern: the next tick switches off and releases every
+        # channel the patterns owned.
 
     # ----- Main tick (to be called by UI/event loop) -----
 
-    def tick(self, now_s: Optional[float] = None) -> None:
+    def tick(self, now_ns: Optional[int] = None) -> None:
         """
-        Evaluate all active patterns at time 'now_s' and apply results.
+        Evaluate all active patterns at monotonic time 'now_ns' (integer
+        nanoseconds, defaults to time.monotonic_ns()) and apply results.
 
         Caller (Qt, etc.) should call this periodically via a timer.
         """
-        if now_s is None:
-            now_s = time.monotonic()
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+
+        owners = self._channel_owners
 
         # 1. Collect desired states from all active patterns.
-        # 2. Resolve ownership & priority for each target.
-        # 3. Call PCMManager / SwitchManager for actual changes (only if changed).
-        ...
+        # 2. Resolve ownership & priority: patterns are visited in activation
+        #    order, so the most recently started pattern wins a shared channel.
+        desired: Dict[tuple, ChannelOwner] = {}
+        buffers = self._buffers
+        owner_ids = self._owner_ids
+        for name, pattern in self._active.items():
+            owner_id = owner_ids[name]
+            buf = buffers[name]
+            pattern.evaluate(now_ns, buf)
+            for key, value in zip(pattern.target_keys, buf):
+                # SWITCH targets (key None) are not applied by the engine yet.
+                if key is not None:
+                    desired[key] = (owner_id, bool(value))
+
+        # 3. Only push channels whose value differs from what was last applied.
+        changes: List[tuple] = []
+        for key, (_, value) in desired.items():
+            prev = owners.get(key)
+            if prev is None or prev[1] != value:
+                changes.append((key, value))
+
+        # Channels a pattern owned but no active pattern drives any more are
+        # switched off and released.
+        released = [
+            key for key, owner in owners.items()
+            if key not in desired and owner[0].startswith("pattern:")
+        ]
+        for key in released:
+            if owners[key][1]:
+                changes.append((key, False))
+            del owners[key]
+
+        if changes:
+            self._pcm.write_many(changes)
+        owners.update(desired)
@@ -1,6 +1,7 @@
 # logging_setup.py
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 def setup_logging():
     logger = logging.getLogger("control_head")
@@ -15,12 +16,20 @@ def setup_logging():
     ch = logging.StreamHandler()
     ch.setLevel(logging.DEBUG)
     ch.setFormatter(fmt)
-    logger.addHandler(ch)
 
     # File (rotating)
     fh = RotatingFileHandler("control_head.log", maxBytes=1_000_000, backupCount=3)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
 
-    return logger
+    # The GUI thread only enqueues records; formatting and console/file I/O
+    # happen on the listener's background thread so a slow disk can't stall
+    # the Qt event loop.
+    q = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(q))
+
+    listener = QueueListener(q, ch, fh, respect_handler_level=True)
+    listener.start()
+
+    # Caller must listener.stop() on shutdown to flush queued records.
+    return logger, listener
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, List, Protocol, Union, Optional
+from array import array
+from typing import List, Protocol, Optional, Tuple
 import logging
 
-from switches import ChannelBinding  # and/or switch names depending on chosen approach
-
 logger = logging.getLogger("control_head.patterns")
 
 
@@ -19,7 +18,7 @@ class PatternTargetType(Enum):
     SWITCH = auto()  # optional, if you decide to drive LogicalSwitch instead of raw channels
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternTarget:
     """
     Describes what a pattern can drive.
@@ -32,6 +31,16 @@ class PatternTarget:
     switch_name: Optional[str] = None
 
 
+def target_key(target: PatternTarget) -> Optional[Tuple[int, int]]:
+    """
+    Plain (node_id, channel_index) key for a CHANNEL target, None otherwise.
+    Used instead of hashing the PatternTarget dataclass on the tick path.
+    """
+    if target.type is PatternTargetType.CHANNEL:
+        return (target.node_id, target.channel_index)
+    return None
+
+
 # ---------- Pattern Interface ----------
 
 class Pattern(Protocol):
@@ -44,19 +53,21 @@ class Pattern(Protocol):
 
     name: str
 
+    # target_key() of each entry in get_targets(), in the same order
+    target_keys: Tuple[Optional[Tuple[int, int]], ...]
+
     def get_targets(self) -> List[PatternTarget]:
         """
         Return all targets this pattern controls.
         """
         ...
 
-    def evaluate(self, now_s: float) -> Dict[PatternTarget, Union[bool, float]]:
+    def evaluate(self, now_ns: int, out: array) -> None:
         """
-        At the given time (in seconds), return the desired state per target.
-
-        Values:
-            bool  -> ON/OFF
-            float -> 0.0 - 1.0 for PWM/brightness (future use)
+        At the given monotonic time (integer nanoseconds), write the desired ON/OFF state of
+        each target into `out` (an array('b') with one slot per entry of
+        get_targets(), same order). The buffer is owned by the caller and
+        reused across ticks.
         """
         ...
 
@@ -81,16 +92,22 @@ class BlinkPattern:
         self._period_s = period_s
         self._duty = duty_cycle
         self._phase = phase_offset_s
+        self.target_keys = tuple(target_key(t) for t in targets)
+
+        # Precomputed for evaluate(), which runs every tick. Integer ns
+        # keeps the phase math exact over long uptimes.
+        self._period_ns = round(period_s * 1e9)
+        self._phase_ns = round(phase_offset_s * 1e9)
+        self._on_threshold_ns = round(duty_cycle * period_s * 1e9)
+        self._all_on = array("b", [1] * len(targets))
+        self._all_off = array("b", [0] * len(targets))
 
     def get_targets(self) -> List[PatternTarget]:
         return self._targets
 
-    def evaluate(self, now_s: float) -> Dict[PatternTarget, bool]:
-        # Implementation to be added:
-        # - Compute phase within period.
-        # - Return True/False for each target accordingly.
-        ...
-        return {}
+    def evaluate(self, now_ns: int, out: array) -> None:
+        on = (now_ns - self._phase_ns) % self._period_ns < self._on_threshold_ns
+        out[:] = self._all_on if on else self._all_off
 
 
 class WigWagPattern:
@@ -109,10 +126,18 @@ class WigWagPattern:
         self._group_a = group_a
         self._group_b = group_b
         self._interval_s = interval_s
+        self.target_keys = tuple(target_key(t) for t in group_a + group_b)
+
+        # One prebuilt output per half-cycle; evaluate() just copies one.
+        self._interval_ns = round(interval_s * 1e9)
+        a, b = len(group_a), len(group_b)
+        self._phases = (
+            array("b", [1] * a + [0] * b),
+            array("b", [0] * a + [1] * b),
+        )
 
     def get_targets(self) -> List[PatternTarget]:
         return self._group_a + self._group_b
 
-    def evaluate(self, now_s: float) -> Dict[PatternTarget, bool]:
-        ...
-        return {}
+    def evaluate(self, now_ns: int, out: array) -> None:
+        out[:] = self._phases[(now_ns // self._interval_ns) & 1]
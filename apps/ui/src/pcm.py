@@ -13,16 +13,37 @@ This module defines:
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Protocol, Callable, Dict, List, Optional, Iterable
+from enum import IntEnum
+from typing import Protocol, Callable, Dict, List, Optional, Iterable, Tuple
 import logging
+import struct
+import weakref
 
 logger = logging.getLogger("control_head.pcm")
 
+_ORIGIN_DEVICE_INIT = {"origin": "pcm.PCMDevice.__init__"}
+_ORIGIN_INIT_CHANNEL = {"origin": "pcm.PCMDevice.init_channel"}
+_ORIGIN_GET_VOLTAGE = {"origin": "pcm.PCMDevice.get_voltage"}
+_ORIGIN_DEVICE_SET_ON = {"origin": "pcm.PCMDevice.set_channel_on"}
+_ORIGIN_DEVICE_SET_OFF = {"origin": "pcm.PCMDevice.set_channel_off"}
+_ORIGIN_SET_CHANNELS = {"origin": "pcm.PCMDevice.set_channels"}
+_ORIGIN_TOGGLE_CHANNEL = {"origin": "pcm.PCMDevice.toggle_channel"}
+_ORIGIN_MANAGER_INIT = {"origin": "pcm.PCMManager.__init__"}
+_ORIGIN_ADD_PCM = {"origin": "pcm.PCMManager.add_pcm"}
+_ORIGIN_SET_ON = {"origin": "pcm.PCMManager.set_channel_on"}
+_ORIGIN_SET_OFF = {"origin": "pcm.PCMManager.set_channel_off"}
+_ORIGIN_WRITE_MANY = {"origin": "pcm.PCMManager.write_many"}
+
 
 # ---------- CAN Abstractions ----------
 
+# Low bits of a PCM frame's arbitration ID carry the node_id (provisional
+# until the PCM protocol is pinned down); PCMManager routes RX frames with it.
+NODE_ID_BITS = 5
+NODE_ID_MASK = (1 << NODE_ID_BITS) - 1
+
 class CanMessage:
     """
     Simple container for CAN frames passed into/from the PCM layer.
@@ -57,15 +78,19 @@ class CanInterface(Protocol):
 
 # ---------- Channel / ADC / GPIO Models ----------
 
-class ChannelHealth(Enum):
-    UNKNOWN = auto()
-    OFF = auto()
-    ON = auto()
-    SHORT = auto()
-    OPEN = auto()
+class ChannelHealth(IntEnum):
+    UNKNOWN = 0
+    OFF = 1
+    ON = 2
+    SHORT = 3
+    OPEN = 4
+
 
+# Health values that count as a channel fault (PCMDevice.fault_mask)
+_FAULT_HEALTHS: frozenset[ChannelHealth] = frozenset({ChannelHealth.SHORT, ChannelHealth.OPEN})
 
-@dataclass
+
+@dataclass(slots=True)
 class ChannelState:
     """
     Represents the last-known state of a single high-side channel.
@@ -77,7 +102,7 @@ class ChannelState:
     actual_on: bool = False     # what PCM reports
 
 
-@dataclass
+@dataclass(slots=True)
 class AdcChannel:
     """
     Represents a single ADC input on the PCM.
@@ -87,7 +112,7 @@ class AdcChannel:
     voltage: float = 0.0      # scaled to volts (if known)
 
 
-@dataclass
+@dataclass(slots=True)
 class GpioPinState:
     """
     Represents a single GPIO pin on the PCM expansion header.
@@ -126,7 +151,22 @@ class PCMDevice:
         self.node_id = node_id
         self.name = name or f"PCM-{node_id}"
         self._can = can
-        logger.info(f"Creating PCMDevice node_id={node_id}, name={name}", extra={"origin": "pcm.PCMDevice.__init__"})
+        logger.info("Creating PCMDevice node_id=%s, name=%s", node_id, name, extra=_ORIGIN_DEVICE_INIT)
+
+        # Per-channel state is stored column-wise (one container per field,
+        # bit i / element i = channel i) so a status frame covering the whole
+        # module updates a few ints/arrays instead of 26 objects. PCMChannel
+        # attributes are views onto these.
+        self.requested_mask: int = 0  # what we asked the PCM to do
+        self.actual_mask: int = 0     # what the PCM reports back
+        self.health: List[ChannelHealth] = [ChannelHealth.UNKNOWN] * self.NUM_CHANNELS
+        self.fault_mask: int = 0      # channels whose health is SHORT/OPEN; kept in step by PCMChannel.health
+        self.current_amps = array("f", bytes(4 * self.NUM_CHANNELS))
+        # Bumped whenever reported state (actual/health/current) changes so
+        # readers like LogicalSwitch.get_state can cache derived values.
+        self.epoch: int = 0
+        # Bound methods (held weakly) called after each reported-state change
+        self._listeners: List[weakref.WeakMethod] = []
 
         self.channels: list[PCMChannel] = [
             PCMChannel(self, i) for i in range(self.NUM_CHANNELS)
@@ -137,8 +177,17 @@ class PCMDevice:
         # Any housekeeping state (heartbeat, firmware version, etc.)
         self.online: bool = False
 
+    def _channel(self, channel: int) -> PCMChannel:
+        """
+        Bounds-checked index into self.channels (negative indices would
+        otherwise silently wrap around).
+        """
+        if not 0 <= channel < self.NUM_CHANNELS:
+            raise IndexError(f"Channel {channel} out of range for PCM {self.name} (0-{self.NUM_CHANNELS - 1})")
+        return self.channels[channel]
+
     def channel(self, index: int, name: str | None = None) -> PCMChannel:
-        ch = self.channels[index]
+        ch = self._channel(index)
         if name:
             ch.name = name
         return ch
@@ -154,11 +203,17 @@ class PCMDevice:
         Initialize and return a PCMChannel instance for the given index.
         Optionally set a label and/or mark as PWM-capable.
         """
-        ch = self.channels[channel_index]
+        ch = self._channel(channel_index)
         if label:
             ch.name = label
         # pwm_capable can be stored/used later as needed
-        logger.info(f"Initialized PCMChannel index={channel_index}, label={label}, pwm_capable={pwm_capable}", extra={"origin": "pcm.PCMDevice.init_channel"})
+        logger.info(
+            "Initialized PCMChannel index=%s, label=%s, pwm_capable=%s",
+            channel_index,
+            label,
+            pwm_capable,
+            extra=_ORIGIN_INIT_CHANNEL,
+        )
         return ch
 
 
@@ -166,7 +221,7 @@ class PCMDevice:
         """
         Return the last-known supply voltage for this PCM.
         """
-        logger.info(f"Getting voltage for PCM {self.name}", extra={"origin": "pcm.PCMDevice.get_voltage"})
+        logger.info("Getting voltage for PCM %s", self.name, extra=_ORIGIN_GET_VOLTAGE)
         # Placeholder implementation
         return 12.0
 
@@ -178,10 +233,12 @@ class PCMDevice:
         - Build and send appropriate CAN command
         - Update `requested_on` flag
         """
-        ch = self.channels[channel]
+        ch = self._channel(channel)
         logger.info(
-            f"Request to turn ON channel {channel} on PCM {self.name}",
-            extra={"origin": "pcm.PCMDevice.set_channel_on"},
+            "Request to turn ON channel %s on PCM %s",
+            channel,
+            self.name,
+            extra=_ORIGIN_DEVICE_SET_ON,
         )
         ch.requested_on = True
 
@@ -189,22 +246,60 @@ class PCMDevice:
         """
         Request: turn the given channel OFF.
         """
-        ch = self.channels[channel]
+        ch = self._channel(channel)
         logger.info(
-            f"Request to turn OFF channel {channel} on PCM {self.name}",
-            extra={"origin": "pcm.PCMDevice.set_channel_off"},
+            "Request to turn OFF channel %s on PCM %s",
+            channel,
+            self.name,
+            extra=_ORIGIN_DEVICE_SET_OFF,
         )
         ch.requested_on = False
 
+    def set_channels(self, states: Dict[int, bool]) -> None:
+        """
+        Request: set several channels ON/OFF at once.
+        Folded into a single set_channels_mask() call.
+        """
+        on_mask = off_mask = 0
+        for channel, on in states.items():
+            bit = 1 << self._channel(channel).index
+            if on:
+                on_mask |= bit
+            else:
+                off_mask |= bit
+        logger.info(
+            "Request to set %d channels on PCM %s",
+            len(states),
+            self.name,
+            extra=_ORIGIN_SET_CHANNELS,
+        )
+        self.set_channels_mask(on_mask, off_mask)
+
+    def set_channels_mask(self, on_mask: int, off_mask: int) -> None:
+        """
+        Request: turn every channel in `on_mask` ON and every channel in
+        `off_mask` OFF (bit i = channel i); other channels are untouched.
+        Implementation should send this as ONE CAN command, payload
+        on_mask.to_bytes(4, "little") + off_mask.to_bytes(4, "little"),
+        rather than one command per channel.
+        """
+        if (on_mask | off_mask) >> self.NUM_CHANNELS or on_mask < 0 or off_mask < 0:
+            raise ValueError(f"Channel mask out of range for PCM {self.name} (0-{self.NUM_CHANNELS - 1})")
+        if on_mask & off_mask:
+            raise ValueError(f"Channels {on_mask & off_mask:#x} requested both ON and OFF on PCM {self.name}")
+        self.requested_mask = (self.requested_mask & ~off_mask) | on_mask
+
     def toggle_channel(self, channel: int) -> None:
         """
         Request: toggle channel state.
         Optional convenience wrapper for UI.
         """
-        ch = self.channels[channel]
+        ch = self._channel(channel)
         logger.info(
-            f"Request to TOGGLE channel {channel} on PCM {self.name}",
-            extra={"origin": "pcm.PCMDevice.toggle_channel"},
+            "Request to TOGGLE channel %s on PCM %s",
+            channel,
+            self.name,
+            extra=_ORIGIN_TOGGLE_CHANNEL,
         )
         # Use requested_on as your "intent" view
         if ch.requested_on:
@@ -225,9 +320,47 @@ class PCMDevice:
         Return a ChannelState snapshot for channel `channel`.
         Uses the underlying PCMChannel's state.
         """
-        ch = self.channels[channel]
+        ch = self._channel(channel)
         return ch.to_state()
 
+    # ----- Reported-state listeners -----
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Call `callback()` after every change to reported channel state.
+        `callback` must be a bound method; it is held weakly so a listener
+        doesn't keep its owner (e.g. a LogicalSwitch) alive.
+        """
+        self._listeners.append(weakref.WeakMethod(callback))
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, callback)]
+
+    def _state_changed(self) -> None:
+        self.epoch += 1
+        dead = False
+        for ref in self._listeners:
+            callback = ref()
+            if callback is None:
+                dead = True
+            else:
+                callback()
+        if dead:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+
+    def set_all_from_frame(self, data: bytes) -> None:
+        """
+        Bulk-update every channel from one status payload:
+          bytes 0-3:  little-endian bitmask, bit i = channel i reported ON
+          bytes 4-55: NUM_CHANNELS x uint16 LE currents in 10 mA units
+        Currents are optional so a short on/off-only frame is accepted.
+        """
+        self.actual_mask = int.from_bytes(data[0:4], "little") & ((1 << self.NUM_CHANNELS) - 1)
+        if len(data) >= 4 + 2 * self.NUM_CHANNELS:
+            raw = struct.unpack_from(f"<{self.NUM_CHANNELS}H", data, 4)
+            self.current_amps[:] = array("f", [r * 0.01 for r in raw])
+        self._state_changed()
+
 
     # ----- ADC / GPIO API (scaffolding) -----
 
@@ -275,7 +408,8 @@ class PCMDevice:
 
         This is the only place that should parse raw frames for this device.
         """
-        ...
+        # Frame decoding goes here; any frame may have changed reported state.
+        self._state_changed()
 
     # ----- Utility / lifecycle -----
 
@@ -292,19 +426,65 @@ class PCMDevice:
 class PCMChannel:
     """
     Represents a single high-side channel on a PCMDevice.
-    Owns its own state and forwards control calls to the parent PCMDevice.
+    State lives in the parent PCMDevice's per-field arrays; this object is a
+    view onto slot `index` and forwards control calls to the PCMDevice.
     """
 
+    __slots__ = ("pcm", "index", "name", "_bit")
+
     def __init__(self, pcm: "PCMDevice", index: int, name: str = ""):
         self.pcm = pcm
         self.index = index
         self.name = name or f"CH{index}"
+        self._bit = 1 << index
 
-        # State that used to live in ChannelState
-        self.health: ChannelHealth = ChannelHealth.UNKNOWN
-        self.current_amps: float = 0.0
-        self.requested_on: bool = False  # what we asked the PCM to do
-        self.actual_on: bool = False     # what the PCM reports back
+    # ----- state (views onto PCMDevice arrays) -----
+
+    @property
+    def requested_on(self) -> bool:
+        return bool(self.pcm.requested_mask & self._bit)
+
+    @requested_on.setter
+    def requested_on(self, on: bool) -> None:
+        if on:
+            self.pcm.requested_mask |= self._bit
+        else:
+            self.pcm.requested_mask &= ~self._bit
+
+    @property
+    def actual_on(self) -> bool:
+        return bool(self.pcm.actual_mask & self._bit)
+
+    @actual_on.setter
+    def actual_on(self, on: bool) -> None:
+        if on:
+            self.pcm.actual_mask |= self._bit
+        else:
+            self.pcm.actual_mask &= ~self._bit
+        self.pcm._state_changed()
+
+    @property
+    def health(self) -> ChannelHealth:
+        return self.pcm.health[self.index]
+
+    @health.setter
+    def health(self, health: ChannelHealth) -> None:
+        pcm = self.pcm
+        pcm.health[self.index] = health
+        if health in _FAULT_HEALTHS:
+            pcm.fault_mask |= self._bit
+        else:
+            pcm.fault_mask &= ~self._bit
+        pcm._state_changed()
+
+    @property
+    def current_amps(self) -> float:
+        return self.pcm.current_amps[self.index]
+
+    @current_amps.setter
+    def current_amps(self, amps: float) -> None:
+        self.pcm.current_amps[self.index] = amps
+        self.pcm._state_changed()
 
     # ----- control helpers -----
 
@@ -352,7 +532,12 @@ class PCMManager:
     def __init__(self, can: CanInterface):
         self._can = can
         self._pcms: Dict[int, PCMDevice] = {}
-        logger.info("PCMManager created", extra={"origin": "pcm.PCMManager.__init__"})
+        # Pre-bound lookup for the per-tick paths (write_many, get_pcm)
+        self._pcms_get = self._pcms.get
+        # RX routing table indexed directly by node_id (arbitration_id &
+        # NODE_ID_MASK): one list index per frame instead of a dict probe.
+        self._by_slot: List[Optional[PCMDevice]] = [None] * (NODE_ID_MASK + 1)
+        logger.info("PCMManager created", extra=_ORIGIN_MANAGER_INIT)
 
         # Register global RX callback
         # self._can.add_rx_callback(self._on_can_message)
@@ -362,17 +547,20 @@ class PCMManager:
         Create and register a PCMDevice for the given node_id.
         Returns the created instance.
         """
-        logger.info(f"Creating PCMDevice node_id={node_id}, name={name}", extra={"origin": "pcm.PCMManager.add_pcm"})
+        if not 0 <= node_id <= NODE_ID_MASK:
+            raise ValueError(f"PCM node_id {node_id} out of range (0-{NODE_ID_MASK})")
+        logger.info("Creating PCMDevice node_id=%s, name=%s", node_id, name, extra=_ORIGIN_ADD_PCM)
         device = PCMDevice(node_id=node_id, can=self._can, name=name)
         self._pcms[node_id] = device
-        logger.info(f"PCMDevice created: {device}", extra={"origin": "pcm.PCMManager.add_pcm"})
+        self._by_slot[node_id] = device
+        logger.info("PCMDevice created: %s", device, extra=_ORIGIN_ADD_PCM)
         return device
 
     def get_pcm(self, node_id: int) -> Optional[PCMDevice]:
         """
         Return the PCMDevice for the given node_id, if any.
         """
-        return self._pcms.get(node_id)
+        return self._pcms_get(node_id)
 
     def all_pcms(self) -> List[PCMDevice]:
         """
@@ -382,26 +570,43 @@ class PCMManager:
 
     def _on_can_message(self, msg: CanMessage) -> None:
         """
-        Global RX dispatcher.
-
-        Implementation (later) should:
-        - Decode which node_id / PCM this frame belongs to.
-        - Find the correct PCMDevice and call device.handle_can_message(msg).
+        Global RX dispatcher: route the frame to its PCMDevice by the node_id
+        bits of the arbitration ID. Frames for unknown nodes are ignored.
         """
-        ...
+        device = self._by_slot[msg.arbitration_id & NODE_ID_MASK]
+        if device is not None:
+            device.handle_can_message(msg)
 
     # Convenience helpers for app/Qt:
 
     def set_channel_on(self, node_id: int, channel: int) -> None:
-        logger.info(f"Setting channel {channel} ON for PCM node_id={node_id}", extra={"origin": "pcm.PCMManager.set_channel_on"})
+        logger.info("Setting channel %s ON for PCM node_id=%s", channel, node_id, extra=_ORIGIN_SET_ON)
         pcm = self._pcms[node_id]
         pcm.set_channel_on(channel)
 
     def set_channel_off(self, node_id: int, channel: int) -> None:
-        logger.info(f"Setting channel {channel} OFF for PCM node_id={node_id}", extra={"origin": "pcm.PCMManager.set_channel_off"})
+        logger.info("Setting channel %s OFF for PCM node_id=%s", channel, node_id, extra=_ORIGIN_SET_OFF)
         pcm = self._pcms[node_id]
         pcm.set_channel_off(channel)
 
+    def write_many(self, changes: Iterable[Tuple[Tuple[int, int], bool]]) -> None:
+        """
+        Apply a batch of ((node_id, channel), on) changes, grouped so each
+        PCM receives a single set_channels() call (one CAN command) rather
+        than one command per channel.
+        """
+        by_node: Dict[int, Dict[int, bool]] = {}
+        for (node_id, channel), on in changes:
+            by_node.setdefault(node_id, {})[channel] = on
+
+        get_pcm = self._pcms_get
+        for node_id, states in by_node.items():
+            pcm = get_pcm(node_id)
+            if pcm is None:
+                logger.warning("write_many: unknown PCM node_id=%s", node_id, extra=_ORIGIN_WRITE_MANY)
+                continue
+            pcm.set_channels(states)
+
     def get_channel_state(self, node_id: int, channel: int) -> ChannelState:
         pcm = self._pcms[node_id]
         return pcm.get_channel_state(channel)
\ No newline at end of file
@@ -1,2422 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.0
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x94\xeb\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22?>\x0a<svg id=\x22L\
-ayer_1\x22 data-nam\
-e=\x22Layer 1\x22 xmln\
-s=\x22http://www.w3\
-.org/2000/svg\x22 x\
-mlns:xlink=\x22http\
-://www.w3.org/19\
-99/xlink\x22 viewBo\
-x=\x220 0 364.74 16\
-2.62\x22>\x0a  <defs>\x0a\
-    <style>\x0a    \
-  .cls-1 {\x0a     \
-   stroke: #cbcb\
-cbff;\x0a        st\
-roke-linecap: ro\
-und;\x0a        str\
-oke-linejoin: ro\
-und;\x0a        str\
-oke-width: .71px\
-;\x0a      }\x0a\x0a     \
- .cls-1, .cls-2 \
-{\x0a        fill: \
-none;\x0a      }\x0a\x0a \
-     .cls-3 {\x0a  \
-      clip-path:\
- url(#clippath-1\
-);\x0a      }\x0a\x0a    \
-  .cls-4 {\x0a     \
-   isolation: is\
-olate;\x0a      }\x0a\x0a\
-      .cls-5 {\x0a \
-       clip-path\
-: url(#clippath)\
-;\x0a      }\x0a    </\
-style>\x0a    <clip\
-Path id=\x22clippat\
-h\x22>\x0a      <rect \
-class=\x22cls-2\x22 wi\
-dth=\x22364.74\x22 hei\
-ght=\x22162.62\x22/>\x0a \
-   </clipPath>\x0a \
-   <clipPath id=\
-\x22clippath-1\x22>\x0a  \
-    <rect class=\
-\x22cls-2\x22 width=\x223\
-65\x22 height=\x22163\x22\
-/>\x0a    </clipPat\
-h>\x0a  </defs>\x0a  <\
-g class=\x22cls-4\x22>\
-\x0a    <g class=\x22c\
-ls-5\x22>\x0a      <g \
-class=\x22cls-3\x22>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M9\
-.28,40.33c2.23-4\
-.31,4.76-8.45,7.\
-56-12.4,3.32-4.6\
-6,7-9.06,11.01-1\
-3.14.95-.97,2.41\
--1.24,3.64-.69,1\
-.57.71,3.14,1.42\
-,4.71,2.12.28.12\
-.49.37.57.67.12.\
-43.21.88.26,1.32\
-.09.84.11,1.7.06\
-,2.54-.02.43-.25\
-.82-.61,1.05-1.8\
-3,1.2-3.62,2.45-\
-5.39,3.75-2.54,1\
-.88-4.87,4.03-6.\
-93,6.43-3.33,3.8\
-7-6.47,7.91-9.4,\
-12.09-1.16,1.66-\
-2.3,3.34-3.41,5.\
-03-.31.47-.65.92\
--1.03,1.35-.02.0\
-2-.04.04-.06.06-\
-.29.25-.72.23-.9\
-8-.06-.2-.22-.34\
--.49-.4-.79-.12-\
-.55-.21-1.12-.24\
--1.69-.13-2.23-.\
-04-4.48.27-6.69.\
-05-.34.17-.67.36\
--.96\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M5.69,81.\
-31v-5.73c0-6.17.\
-09-12.34.27-18.5\
-.08-2.88-.14-5.7\
-6-.68-8.59-.5-2.\
-61-1.06-5.21-1.6\
-8-7.8-.05-.21-.0\
-2-.43.1-.61.45-.\
-69,1.04-1.28,1.7\
-3-1.72,2.23-1.43\
-,4.46-2.86,6.68-\
-4.3\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M.35,81.31\
-v-10.15c0-8.11.3\
-4-16.21,1.02-24.\
-29.18-2.22.95-4.\
-35,2.22-6.19\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-26.48,16.21l-.27\
--.15c-.23-.12-.5\
-1-.08-.69.12-1.8\
-3,2.01-3.7,3.99-\
-5.61,5.94-.63.65\
--1.38,1.16-2.21,\
-1.54-.14.06-.23.\
-19-.26.34l-.12,1\
-.99c-.01.26-.09.\
-51-.22.74-1.72,2\
-.2-3.28,4.52-4.6\
-5,6.96-.08.15-.1\
-9.28-.33.38\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M3\
-1.5,14.1c2.88-2.\
-39,6.33-4,10.02-\
-4.64,3.46-.61,6.\
-96-.92,10.47-.94\
-,13.28-.07,26.57\
--.07,39.85-.02,1\
-.9,0,3.8.18,5.67\
-.53,1.62.3,3.16.\
-96,4.5,1.93\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-18.12,21.48l18.8\
-6,7.04c1.25.46,2\
-.52.86,3.81,1.19\
-,2.43.61,4.91,1.\
-04,7.4,1.27,6.24\
-.58,12.51.88,18.\
-78.88,26.02,0,52\
-.05.09,78.08.27,\
-1.42,0,2.85-.04,\
-4.26-.13,2.1-.14\
-,4.12-.84,5.87-2\
-.02,4.11-2.8,8.0\
-5-5.83,11.8-9.09\
-,1.2-1.04,2.15-2\
-.35,2.77-3.82.54\
--1.27.86-2.62.95\
--3.99.12-1.45.16\
--2.91.14-4.37\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M118.22,16.66c.4\
-7-2.31,1.18-4.57\
-,2.13-6.72.66-1.\
-5,1.52-2.9,2.56-\
-4.17.77-.94,1.62\
--1.81,2.54-2.61,\
-1.17-1.01,2.49-1\
-.82,3.93-2.4.96-\
-.39,2-.5,3.02-.3\
-3.08.01.13.08.12\
-.16l-3.26,16.98c\
--.04.2-.2.36-.4.\
-39-.5.09-1,.12-1\
-.51.11-2.16-.05-\
-4.32-.22-6.47-.5\
-1-.84-.12-1.66-.\
-31-2.46-.57-.14-\
-.04-.22-.18-.19-\
-.32\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M125.75,18\
-.02l-.4,1.94c-.0\
-4.21-.21.36-.42.\
-39h-7.27s-.04,0-\
-.07,0c-.2-.04-.3\
-4-.23-.3-.43.19-\
-1.05.52-2.07.97-\
-3.04\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M125.52,1\
-8l2.29-6.5c1.32-\
-3.75,2.77-7.46,4\
-.35-11.11\x22/>\x0a   \
-     <line class\
-=\x22cls-1\x22 x1=\x22127\
-.52\x22 y1=\x2218.08\x22 \
-x2=\x22131.66\x22 y2=\x22\
-1.55\x22/>\x0a        \
-<line class=\x22cls\
--1\x22 x1=\x22127.36\x22 \
-y1=\x2224.92\x22 x2=\x221\
-25.86\x22 y2=\x2218.02\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M355.5,27.09l\
--4.91-10.49c-.39\
--.83-1.18-1.41-2\
-.09-1.52-6.16-.8\
--12.33-1.54-18.5\
--2.25-3.29-.38-6\
-.58-.79-9.86-1.2\
-4-1.07-.15-2.14-\
-.32-3.21-.53-.99\
--.19-1.98-.31-2.\
-99-.36-17.86-.15\
--35.73-.17-53.59\
--.08\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M248.49,1\
-0.69c-3.35.03-6.\
-7.06-10.05.09\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M225.02,13c-10.9\
-8-.14-21.96-.26-\
-32.93-.35\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M176\
-.94,12.55c-15.57\
--.09-31.14-.11-4\
-6.71-.07\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M119.\
-35,12.5c-1-.05-1\
-.99-.17-2.96-.38\
--2.81-.59-5.65-.\
-97-8.51-1.13-19.\
-5-.34-39-.46-58.\
-51-.36-2.78.02-5\
-.56.22-8.31.61-2\
-.93.42-5.82,1.13\
--8.61,2.12\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M41\
-.06,11.23l.22-.5\
-5c.18-.46.5-.86.\
-91-1.15.21-.14.4\
-4-.25.69-.3\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M2\
-25.02,13l1.23.02\
-c1.04.01,2.06-.1\
-6,3.03-.52,1.18-\
-.44,2.4-.79,3.63\
--1.06,1.82-.39,3\
-.67-.61,5.53-.66\
-\x22/>\x0a        <lin\
-e class=\x22cls-1\x22 \
-x1=\x22232.38\x22 y1=\x22\
-9.58\x22 x2=\x22130.79\
-\x22 y2=\x229.58\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M12\
-0.52,9.58h-1.2c-\
-.83,0-1.66.21-2.\
-39.61-.74.39-1.3\
-8.97-1.84,1.67\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M232.38,9.58h4.\
-06c.38,0,.75.05,\
-1.12.13.59.14,1.\
-09.53,1.36,1.07\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M245.59,10.71c\
-2.74-1.12,5.66-1\
-.74,8.61-1.83,17\
-.5-.18,35-.39,52\
-.49-.61,1.57-.02\
-,3.14.2,4.64.64,\
-1.09.32,2.16.68,\
-3.23,1.07.57.22,\
-1.11.53,1.57.93\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M362.7,81.31v-\
-34.46c0-1.08-.1-\
-2.16-.3-3.23-2.1\
-8-8.49-5.27-16.7\
-3-9.21-24.56-.09\
--.17-.18-.34-.27\
--.51-.07-.13-.19\
--.24-.33-.3-.47-\
-.21-.96-.39-1.47\
--.52\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M363.29,8\
-1.31v-34.46c0-1.\
-12-.11-2.25-.31-\
-3.36-.79-3.07-1.\
-69-6.11-2.71-9.1\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M364.39,81.31\
-v-33.24c0-2.33-.\
-23-4.66-.68-6.94\
--.28-1.41-.6-2.8\
-1-.96-4.2-.03-.1\
-2-.06-.25-.09-.3\
-7-.03-.11-.09-.2\
-2-.17-.29-1.01-.\
-88-2.04-1.74-3.0\
-9-2.58\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M333.7,\
-13.91c-1.31.7-2.\
-46,1.65-3.37,2.8\
-2-.21.27-.34.6-.\
-36.95-.03.51-.02\
-,1.02.04,1.53.06\
-.55.53.96,1.08.9\
-5.98-.02,1.96-.0\
-3,2.93-.03.74,0,\
-1.48.05,2.21.15,\
-2,.28,4,.65,5.96\
-,1.11,1.38.32,2.\
-64,1,3.69,1.95,1\
-.45,1.32,2.8,2.7\
-3,4.07,4.23.46.5\
-5,1.13.88,1.86.9\
-2.58.03,1.17.03,\
-1.75,0,.11,0,.21\
--.01.32-.03.11-.\
-01.19-.11.18-.22\
-,0-.01,0-.02,0-.\
-04-1.29-3.28-2.6\
-6-6.53-4.11-9.74\
--.55-1.22-1.74-2\
-.02-3.07-2.08-5.\
-03-.21-10.06-.46\
--15.08-.73-.26-.\
-02-.51.07-.71.22\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M333.7,13.91l\
-.67-.32c.25-.12.\
-53-.18.8-.16\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-321.68,81.31v-44\
-.55c0-.6.11-1.2.\
-33-1.75.4-1.03,1\
-.11-1.92,2.02-2.\
-54,1.16-.78,2.38\
--1.46,3.67-2,4.3\
-6-1.85,8.59-3.99\
-,12.66-6.39,1.09\
--.64,2.07-1.44,2\
-.93-2.36\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M333.\
-86,17.52c4.15.07\
-,8.3.2,12.45.41,\
-1.45.07,2.72.99,\
-3.24,2.35,1.04,2\
-.72,2.02,5.46,2.\
-92,8.23\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M333.8\
-6,17.52h-.25c-.2\
-4,0-.48.1-.63.29\
--.11.13-.17.3-.1\
-8.46-.01.57,0,1.\
-14.03,1.71,0,.07\
-.05.12.12.13\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-333.25,17.59c.66\
--.59,1.38-1.11,2\
-.12-1.58.16-.1.3\
-5-.15.54-.15\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-343.97,81.31v-18\
-.74c0-6.24-.7-12\
-.45-2.09-18.54-.\
-62-2.71-1.51-5.3\
-6-2.66-7.89-.44-\
-.97-1.21-1.76-2.\
-17-2.22-1.11-.45\
--2.25-.82-3.41-1\
-.1-2.34-.59-4.68\
--1.22-7-1.88\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-342.62,81.31v-18\
-.74c0-4.06-.3-8.\
-12-.9-12.13\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M3\
-52.21,81.31v-16.\
-65c0-9.57-.52-19\
-.14-1.56-28.66-.\
-11-.98-.4-1.94-.\
-87-2.81-.59-1.1-\
-1.39-2.07-2.36-2\
-.87-.22-.18-.52-\
-.25-.8-.18-3.36,\
-1.1-6.69,2.32-9.\
-98,3.62\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M349.8\
-9,81.31v-16.65c0\
--9.37-.5-18.73-1\
-.5-28.04\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M281.\
-86,32.48l30.14.1\
-2c3.16.01,6.29-.\
-58,9.23-1.74,1.0\
-2-.4,2.02-.82,3.\
-03-1.25,3.06-1.3\
-1,6.02-2.83,8.86\
--4.56.37-.22.7-.\
-49,1-.79.27-.27.\
-27-.71,0-.98-.03\
--.03-.06-.05-.09\
--.08-.36-.25-.75\
--.45-1.17-.58-3.\
-92-1.28-8.01-2.0\
-1-12.13-2.16-7.8\
-8-.29-15.76-.4-2\
-3.64-.33-2.33.02\
--4.65.35-6.89,1-\
-6.21,1.8-11.99,4\
-.82-17,8.89-.27.\
-22-.3.61-.09.88h\
-0c.18.21.38.41.5\
-9.57.29.23.63.37\
-,1,.41,2.38.31,4\
-.77.5,7.16.58\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M333.66,24.7c-4.\
-12-1.71-8.52-2.6\
-5-12.98-2.76-7.8\
-5-.29-15.71-.4-2\
-3.57-.33-2.2.02-\
-4.39.34-6.5.95-6\
-.18,1.75-11.9,4.\
-84-16.77,9.02\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M320.27,22.82c-6\
-.9-.21-13.8-.29-\
-20.7-.23-2.08.02\
--4.15.32-6.15.9-\
-4.52,1.29-8.79,3\
-.3-12.66,5.96\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M280.17,30.94c.5\
-7.04,1.15.06,1.7\
-2.08l30.12.12c2.\
-97.01,5.92-.54,8\
-.69-1.64.97-.36,\
-1.93-.78,2.86-1.\
-25\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M280.76,29.\
-44l-.3.22c-.25.1\
-7-.46.4-.61.66-.\
-11.2-.05.45.14.5\
-6.05.03.12.05.18\
-.05\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M323.56,28\
-.26l.6-.3c1.48-.\
-75,2.95-1.54,4.3\
-8-2.38.32-.18.43\
--.59.24-.91,0,0,\
-0-.01-.01-.02-.1\
-4-.24-.36-.43-.6\
--.55-.21-.11-.43\
--.19-.66-.25-1.4\
-5-.35-2.92-.6-4.\
-41-.78-.94-.11-1\
-.89-.2-2.84-.26\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M321.68,44.88h\
-16.36c.56,0,1.09\
-.25,1.45.69,1.15\
-,1.41,1.92,3.08,\
-2.24,4.87\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M338\
-.04,44.88l-2.32-\
-6.56c-.2-.58-.16\
--1.22.12-1.77.12\
--.24.26-.47.4-.7\
-.37-.59.78-1.16,\
-1.23-1.69\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M335\
-.6,37.43c-4.63-.\
-41-9.26-.8-13.89\
--1.17\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M108.82,\
-23.72c9.43,2.95,\
-18.82,6.02,28.16\
-,9.22.93.32,1.89\
-.52,2.87.6,6.5.5\
-7,13.02.91,19.55\
-,1.03,11.8.2,23.\
-6.29,35.4.26,38.\
-56-.09,77.12.11,\
-115.68.62,2.74.0\
-3,5.48.09,8.21.1\
-6,1.02.03,2.05.1\
-1,3.06.25\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M108\
-.56,24.77c9.45,2\
-.78,18.83,5.8,28\
-.13,9.04,1,.34,2\
-.04.56,3.08.66,6\
-.52.57,13.07.91,\
-19.61,1.03,11.8.\
-21,23.61.29,35.4\
-1.27,38.55-.1,77\
-.11.11,115.67.62\
-,2.73.04,5.47.09\
-,8.2.17.99.03,1.\
-98.11,2.96.24\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M200.84,31.91c-.\
-93-3.43-1.97-6.8\
-3-3.12-10.2-.26-\
-.75-.44-1.52-.57\
--2.3-.17-1.1-.35\
--2.19-.53-3.29-.\
-19-1.12-.54-2.21\
--1.06-3.24-.05-.\
-09-.12-.17-.2-.2\
-3\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M91.29,81.31\
-v-2.45c0-8,.4-16\
-,1.19-23.96.82-8\
-.23,2.98-16.26,6\
-.38-23.8.73-1.63\
-,1.63-3.18,2.68-\
-4.62.21-.29.45-.\
-57.71-.82.36-.34\
-.85-.5,1.34-.43,\
-2.79.38,5.54.99,\
-8.22,1.83,8.28,2\
-.58,16.54,5.21,2\
-4.79,7.89\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M95.\
-68,81.31v-2.45c0\
--7.95.4-15.89,1.\
-19-23.8.81-8.06,\
-2.92-15.93,6.25-\
-23.31.57-1.27,1.\
-25-2.48,2.02-3.6\
-3\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M106.7,27.38\
-c1.56.32,3.11.73\
-,4.64,1.2,7.95,2\
-.48,15.89,5,23.8\
-1,7.57\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M135.08\
-,81.31v-4.74c0-4\
-.87.14-9.73.42-1\
-4.59.48-8.39,1.1\
--16.77,1.84-25.1\
-4.02-.25.04-.49.\
-07-.74.05-.53-.3\
--1.02-.81-1.15\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M133.49,81.31v-\
-4.74c0-4.9.14-9.\
-8.42-14.68.49-8.\
-39,1.1-16.77,1.8\
-4-25.14\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M135.1\
-5,36.15l.25.09c.\
-22.07.37.28.36.5\
-2\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M105.14,28.1\
-2l.14-.21c.31-.4\
-6.88-.68,1.42-.5\
-4\x22/>\x0a        <li\
-ne class=\x22cls-1\x22\
- x1=\x22199.66\x22 y1=\
-\x2242.61\x22 x2=\x22218.\
-31\x22 y2=\x2242.61\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M218.53,36.97v5.\
-42c0,.12-.1.21-.\
-21.22\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M198.4,3\
-6.74v4.51c0,.71.\
-55,1.31,1.26,1.3\
-6\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M217.28,36.4\
-9h-18.64c-.13,0-\
-.24.11-.24.24h0\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M217.28,36.49h\
-.75c.27,0,.49.21\
-.5.48\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M218.53,\
-38.02h-12.97c-2.\
-39,0-4.75-.52-6.\
-91-1.53\x22/>\x0a     \
-   <line class=\x22\
-cls-1\x22 x1=\x22318.7\
-7\x22 y1=\x2243.32\x22 x2\
-=\x22302.5\x22 y2=\x2243.\
-32\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M320.02,37.\
-46v4.51c0,.72-.5\
-5,1.31-1.26,1.36\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M303.35,37.21\
-h16.43c.14,0,.24\
-.11.24.25\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M301\
-.89,38.73h10.97c\
-2.39,0,4.75-.52,\
-6.91-1.53\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M301\
-.88,43.07v-4.18c\
-0-.14.04-.28.11-\
-.4.27-.44.62-.84\
-,1.03-1.16.09-.0\
-7.21-.12.34-.12\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M302.5,43.32h-\
-.39c-.13,0-.23-.\
-12-.22-.25\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M19\
-8.4,38.37h-37.25\
-c-6.53,0-13.05-.\
-29-19.55-.86-1.4\
-3-.12-2.85-.3-4.\
-27-.51\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M218.53\
-,36.97c28.16-.18\
-,56.33-.06,84.49\
-.36\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M218.53,38\
-.39c27.79-.18,55\
-.58-.06,83.37.34\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M218.53,42.1c\
-27.79-.18,55.57-\
-.06,83.35.34\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-118.12,21.48l-1.\
-91-.72c-.8-.3-1.\
-56-.7-2.26-1.21-\
-.68-.49-1.23-1.1\
-5-1.6-1.9-.29-.5\
-8-.53-1.18-.72-1\
-.8-.14-.43-.3-.8\
-6-.49-1.27-.48-1\
-.08-.78-2.24-.87\
--3.42\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M129.11,\
-17.82c47.2.03,94\
-.39.24,141.58.62\
-,4.6.04,9.2.24,1\
-3.78.62,3.07.25,\
-6.12.7,9.14,1.34\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M126.23,19.75\
-c47.11.02,94.23.\
-21,141.34.6\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-17.82,17.91c-.1,\
-0-.21,0-.31,0-1.\
-52.02-3.04.29-4.\
-47.8\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M85.85,81\
-.31v-5.56c0-6.58\
-.32-13.15.96-19.\
-7.36-3.71.92-7.3\
-9,1.67-11.04,1.2\
-9-6.24,3.81-12.1\
-5,7.42-17.38.53-\
-.76,1.12-1.48,1.\
-77-2.13.72-.73,1\
-.61-1.27,2.59-1.\
-58.78-.25,1.57-.\
-43,2.38-.54,2.06\
--.29,4.16-.17,6.\
-18.34\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M86.93,8\
-1.31v-5.56c0-6.5\
-4.32-13.09.96-19\
-.6.36-3.67.91-7.\
-31,1.66-10.92,1.\
-26-6.09,3.72-11.\
-87,7.25-16.99.49\
--.71,1.04-1.38,1\
-.65-1.98.6-.6,1.\
-34-1.05,2.15-1.3\
-1.72-.23,1.45-.3\
-9,2.2-.5,1.92-.2\
-7,3.88-.16,5.76.\
-32\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M13.89,51.6\
-6c4.98-8.31,10.8\
-7-16.04,17.57-23\
-.05.95-.99,1.97-\
-1.93,3.03-2.8,1.\
-07-.86,2.31-1.47\
-,3.64-1.79,1.49-\
-.36,3.01-.59,4.5\
-4-.69,3.83-.26,7\
-.68-.4,11.52-.4,\
-13.04,0,26.08-.5\
-3,39.09-1.58,1.6\
-7-.14,3.35-.16,5\
-.02-.07,1.71.09,\
-3.4.31,5.08.64,1\
-.01.2,1.94.67,2.\
-71,1.35\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M88.48\
-,45.01l-71.34,8.\
-03c-.41.05-.83.0\
-3-1.23-.06-.75-.\
-15-1.43-.51-1.98\
--1.03-.08-.08-.1\
--.2-.04-.3\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M13\
-.85,51.88l62.75-\
-7.24c2.41-.28,4.\
-82-.37,7.24-.27,\
-1.56.06,3.12.28,\
-4.64.64\x22/>\x0a     \
-   <line class=\x22\
-cls-1\x22 x1=\x2241.83\
-\x22 y1=\x2281.31\x22 x2=\
-\x2241.83\x22 y2=\x2264.9\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M54.23,81.31v\
--16.6c0-.62-.14-\
-1.23-.42-1.79-.8\
-2-1.68-2.37-2.9-\
-4.21-3.29-1.14-.\
-25-2.32-.25-3.46\
--.01-2.5.52-4.3,\
-2.73-4.31,5.29\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M49.23,81.31v-1\
-4.97c0-.38-.18-.\
-75-.49-.98-.93-.\
-69-2.03-1.11-3.1\
-9-1.2\x22/>\x0a       \
- <line class=\x22cl\
-s-1\x22 x1=\x2274.93\x22 \
-y1=\x2281.31\x22 x2=\x227\
-4.93\x22 y2=\x2261.6\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M49.6,59.62l23.\
-77.37c.87.02,1.5\
-7.73,1.56,1.6\x22/>\
-\x0a        <line c\
-lass=\x22cls-1\x22 x1=\
-\x2254.2\x22 y1=\x2264.25\
-\x22 x2=\x2274.48\x22 y2=\
-\x2260.47\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M338.09\
-,34.61l9.85-3.65\
-c.07-.02.14-.02.\
-2.02\x22/>\x0a        \
-<line class=\x22cls\
--1\x22 x1=\x22340.22\x22 \
-y1=\x2238.54\x22 x2=\x223\
-50.03\x22 y2=\x2234.91\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M350.03,34.91\
-l.27-.1c.05-.02.\
-09-.08.08-.14\x22/>\
-\x0a        <line c\
-lass=\x22cls-1\x22 x1=\
-\x22340.58\x22 y1=\x2239.\
-51\x22 x2=\x22350.38\x22 \
-y2=\x2235.88\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M350\
-.38,35.88l.17-.0\
-6s.06-.05.06-.09\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M349.45,81.31\
-v-12.66c0-9.78-.\
-49-19.55-1.47-29\
-.27-.03-.27-.08-\
-.54-.16-.8-.14-.\
-47-.62-.75-1.1-.\
-64-2.06.47-4.08,\
-1.06-6.07,1.78\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M355.5,27.09l.1\
-.21c.06.13.11.26\
-.16.4,0,.01,0,.0\
-2,0,.03.06.23-.0\
-8.46-.3.51-.46.1\
-2-.95.16-1.43.12\
-\x22/>\x0a        <lin\
-e class=\x22cls-1\x22 \
-x1=\x22357.36\x22 y1=\x22\
-28.29\x22 x2=\x22355.6\
-3\x22 y2=\x2228.15\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-10.34,50.46c4.99\
--10.56,10.6-20.8\
-2,16.79-30.73.25\
--.4.54-.77.88-1.\
-11.34-.35.86-.46\
-,1.32-.28,2.55.9\
-8,5.12,1.91,7.7,\
-2.81\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M37.04,18\
-.22l-5.54-2.36c-\
-.32-.14-.7-.02-.\
-89.28-.45.72-.83\
-,1.47-1.16,2.25\x22\
-/>\x0a        <line\
- class=\x22cls-1\x22 x\
-1=\x228.9\x22 y1=\x2249.6\
-8\x22 x2=\x2224.43\x22 y2\
-=\x2224.14\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M9.76,\
-81.31v-3.88c0-5.\
-88.25-11.75.74-1\
-7.61.26-3.1.38-6\
-.2.34-9.31,0-.24\
-,0-.47.03-.71\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M4.92,46.66c1.16\
--1.34,2.44-2.57,\
-3.82-3.69\x22/>\x0a   \
-     <line class\
-=\x22cls-1\x22 x1=\x22318\
-.4\x22 y1=\x2281.07\x22 x\
-2=\x22318.4\x22 y2=\x2279\
-.28\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M310.33,81\
-.31v-.14c0-.26.0\
-8-.5.23-.71.6-.8\
-1,1.54-1.3,2.55-\
-1.34h5.13c.09,0,\
-.16.07.16.15\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-318.4,81.07h-5.8\
-5c-.13,0-.24.1-.\
-25.24\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M318.4,8\
-1.07h.07c.13,0,.\
-24.11.24.24\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-37.41,36.1l.09-.\
-62c.1-.69.3-1.35\
-.6-1.98\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M138.1\
-,33.5l.07-.14s0-\
-.08-.03-.09t0,0\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M114.41,19.86c\
--2.4.43-4.54,1.7\
-8-5.97,3.76\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M2\
-.44,81.31v-4.72c\
-0-6.61.19-13.21.\
-57-19.8.08-1.32.\
-28-2.63.61-3.92.\
-36-1.39.95-2.72,\
-1.75-3.91\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M11,\
-46.21c-.22-.62-.\
-34-1.27-.36-1.93\
-,0-.11,0-.23,0-.\
-34,0-.08.02-.16.\
-05-.22,5.01-8.7,\
-10.52-17.09,16.4\
-9-25.15.31-.41.6\
-4-.8,1.01-1.16.2\
-9-.29.7-.4,1.09-\
-.3.23.06.45.13.6\
-7.21\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M10.36,42\
-.08l.14,1.5c0,.0\
-8.08.14.16.13.02\
-,0,.04,0,.05-.01\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M10.36,42.08v\
--.14c-.02-.06,0-\
-.13.02-.18.9-1.8\
-9,1.9-3.74,2.99-\
-5.53,2.72-4.45,5\
-.6-8.79,8.66-13.\
-01,1.49-2.06,3.1\
--4.05,4.81-5.94.\
-31-.34.63-.67.97\
--.99.21-.19.42-.\
-38.63-.57.57-.49\
-,1.38-.6,2.07-.2\
-9.33.15.66.29,1,\
-.42\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M96.42,25.\
-45c-4.18-1.23-8.\
-53-1.7-12.88-1.3\
-9-11.13.79-22.28\
-,1.13-33.44,1.02\
--4.11-.04-8.21,0\
--12.32.13-2.18.0\
-7-4.35.2-6.51.39\
--.15.01-.3.06-.4\
-3.15\x22/>\x0a        \
-<line class=\x22cls\
--1\x22 x1=\x2296.42\x22 y\
-1=\x2225.45\x22 x2=\x2297\
-.41\x22 y2=\x2225.77\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M36.21,16.23c2.\
-98-.7,5.92-1.59,\
-8.79-2.67,1.49-.\
-56,3.05-.93,4.63\
--1.1,10.69-1.13,\
-21.45-1.57,32.19\
--1.29,5.65.15,11\
-.29.34,16.93.58,\
-4.27.18,8.47,1.1\
-4,12.39,2.85\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-37.12,19.49c8.38\
--1.23,16.8-2.15,\
-25.25-2.75,11.88\
--.85,23.78-1.47,\
-35.69-1.86,4.4-.\
-14,8.81-.15,13.2\
-1-.02\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M36.29,1\
-6.27l.18.08c.59.\
-26,1.22.42,1.87.\
-48,6.11.53,12.26\
-.65,18.39.36\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-111.41,15.21c2.3\
-8,0,4.76,0,7.14,\
-0\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M129.7,15.23\
-c15.59,0,31.18,0\
-,46.78,0\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M191.\
-16,15.22c15.11-.\
-02,30.21-.04,45.\
-32-.07,3.31,0,6.\
-61.1,9.91.31\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-205.39,31.93c-.2\
-3-4.02-.7-8.02-1\
-.39-11.99\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M195\
-.32,31.9c-.85-2.\
-98-2.02-5.87-3.4\
-7-8.61-.61-1.15-\
-1.24-2.29-1.9-3.\
-41\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M9.15,40.56\
-c-.05.31,0,.63.1\
-5.91.05.1.12.18.\
-21.24.12.09.25.1\
-7.38.24.14.08.31\
-.1.47.05\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M5.55\
-,81.31c0-2.92-.6\
-2-5.28-1.38-5.28\
-s-1.38,2.37-1.38\
-,5.28\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M4.02,76\
-.06v-2.04c0-5.58\
-.11-11.17.33-16.\
-75.07-1.92.55-3.\
-8,1.4-5.51\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M24\
-6.44,13.62c-1.29\
--.04-2.55-.4-3.6\
-6-1.06-.12-.07-.\
-22-.19-.26-.32-.\
-11-.32.06-.66.38\
--.77.93-.32,1.89\
--.52,2.87-.6,4.3\
-3-.34,8.67-.51,1\
-3.01-.52,1.11,0,\
-2.19.36,3.07,1.0\
-4.2.16.32.39.34.\
-64.04.5-.25.96-.\
-7,1.16-.39.17-.8\
-.28-1.23.34-.89.\
-11-1.78.16-2.67.\
-16-.2,0-.38-.1-.\
-49-.26-.2-.3-.37\
--.61-.52-.93-.11\
--.23-.32-.39-.57\
--.42-.42-.06-.84\
--.09-1.26-.09-2.\
-28,0-4.56.03-6.8\
-4.11-.19,0-.36.1\
--.46.26-.18.29-.\
-34.6-.48.92-.09.\
-21-.3.34-.52.34\x22\
-/>\x0a        <line\
- class=\x22cls-1\x22 x\
-1=\x22258.37\x22 y1=\x221\
-0.36\x22 x2=\x22258.38\
-\x22 y2=\x2213.68\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M2\
-46.45,13.62c3.7.\
-35,7.43.38,11.13\
-.07\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M177.36,15\
-.31c-1.29-.04-2.\
-55-.4-3.66-1.06-\
-.12-.07-.22-.19-\
-.27-.32-.11-.32.\
-06-.66.38-.77.93\
--.32,1.89-.52,2.\
-87-.59,4.33-.34,\
-8.67-.51,13.01-.\
-51,1.11,0,2.19.3\
-6,3.07,1.04.2.15\
-.32.38.34.63.03.\
-5-.25.96-.7,1.16\
--.39.18-.8.29-1.\
-23.34-.89.1-1.78\
-.16-2.67.16-.2,0\
--.38-.1-.49-.27-\
-.2-.29-.37-.61-.\
-52-.93-.11-.23-.\
-32-.38-.57-.42-.\
-42-.06-.84-.09-1\
-.26-.09-2.28,0-4\
-.56.03-6.84.1-.1\
-9,0-.36.11-.46.2\
-7-.18.29-.34.6-.\
-48.92-.09.21-.29\
-.34-.52.34\x22/>\x0a  \
-      <line clas\
-s=\x22cls-1\x22 x1=\x2218\
-9.29\x22 y1=\x2212.05\x22\
- x2=\x22189.3\x22 y2=\x22\
-15.37\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M177.37,\
-15.31c3.7.35,7.4\
-3.38,11.13.07\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M330.33,16.72c-3\
-.85-.11-7.69-.25\
--11.54-.4-.72-.0\
-3-1.41-.26-2.01-\
-.66-1.34-.92-2.8\
-2-1.6-4.38-2.04-\
-4.8-1.33-9.75-2.\
-07-14.73-2.19-11\
-.86-.3-23.73-.25\
--35.59.15\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M242\
-.49,11.99h-.53c-\
-2.41,0-4.79.45-7\
-.04,1.32-.14.06-\
-.21.22-.16.36.03\
-.09.11.16.2.18,3\
-.78.73,7.59,1.25\
-,11.43,1.53.02,0\
-,.04.02.04.05,0,\
-.02-.02.04-.05.0\
-4\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M317.96,16.2\
-c-3.95-.22-7.92-\
-.14-11.86.24\x22/>\x0a\
-        <line cl\
-ass=\x22cls-1\x22 x1=\x22\
-249.73\x22 y1=\x2220.2\
-1\x22 x2=\x22251.07\x22 y\
-2=\x2231.75\x22/>\x0a    \
-    <line class=\
-\x22cls-1\x22 x1=\x22251.\
-16\x22 y1=\x2220.22\x22 x\
-2=\x22252.45\x22 y2=\x223\
-1.35\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M357.36,8\
-1.31v-29.06c0-1.\
-23-.18-2.46-.53-\
-3.64-.78-2.64-1.\
-36-5.33-1.73-8.0\
-6-.55-4.03-1.15-\
-8.05-1.8-12.06\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M354.41,81.31v-\
-2.05c0-.33.09-.6\
-5.26-.93.43-.73,\
-1-1.37,1.66-1.89\
-.29-.23.65-.34,1\
-.02-.33\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M359.9\
-5,81.31v-10.98c0\
--3.63-.2-7.25-.5\
-9-10.86-1.14-10.\
-42-2.6-20.81-4.3\
-8-31.14\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M361.2\
-9,81.31v-34.01c0\
--1.37-.14-2.73-.\
-43-4.07-.37-1.72\
--.84-3.42-1.4-5.\
-08-.45-1.33-1.79\
--2.16-3.18-1.98\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M352.19,28.5l2\
-.31,21.28c.17,1.\
-53.39,3.05.65,4.\
-56.17.97.68,1.85\
-,1.44,2.48.21.18\
-.48.29.77.32.57.\
-06,1.07.39,1.35.\
-89.34.61.57,1.27\
-.7,1.96\x22/>\x0a     \
-   <line class=\x22\
-cls-1\x22 x1=\x22354.9\
-9\x22 y1=\x2253.38\x22 x2\
-=\x22354.99\x22 y2=\x2239\
-.78\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M359.64,81\
-.31c0-2.88-.5-5.\
-22-1.11-5.22s-1.\
-11,2.34-1.11,5.2\
-2\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M9.28,122.29\
-c2.23,4.31,4.76,\
-8.45,7.56,12.4,3\
-.32,4.66,7,9.06,\
-11.01,13.14.95.9\
-7,2.41,1.24,3.64\
-.68,1.57-.71,3.1\
-4-1.41,4.71-2.12\
-.28-.12.49-.37.5\
-7-.67.12-.43.21-\
-.88.26-1.33.09-.\
-84.11-1.69.06-2.\
-54-.02-.42-.25-.\
-81-.61-1.05-1.83\
--1.2-3.62-2.45-5\
-.39-3.75-2.54-1.\
-88-4.87-4.03-6.9\
-3-6.43-3.33-3.87\
--6.47-7.91-9.4-1\
-2.09-1.16-1.66-2\
-.3-3.34-3.41-5.0\
-3-.31-.47-.65-.9\
-2-1.03-1.35-.25-\
-.29-.69-.31-.98-\
-.06-.02.02-.04.0\
-4-.06.06-.2.22-.\
-34.49-.4.78-.12.\
-56-.21,1.12-.24,\
-1.69-.13,2.23-.0\
-4,4.48.27,6.7.05\
-.34.17.67.36.96\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M5.69,81.31v5.\
-73c0,6.17.09,12.\
-34.27,18.5.08,2.\
-88-.14,5.76-.68,\
-8.59-.5,2.61-1.0\
-6,5.21-1.68,7.8-\
-.05.21-.02.43.1.\
-61.45.69,1.04,1.\
-28,1.73,1.72,2.2\
-3,1.43,4.46,2.86\
-,6.68,4.31\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M.3\
-5,81.31v10.15c0,\
-8.11.34,16.21,1.\
-02,24.29.18,2.22\
-.95,4.36,2.22,6.\
-19\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M26.48,146.\
-41l-.27.15c-.23.\
-12-.51.07-.69-.1\
-2-1.83-2.01-3.7-\
-4-5.61-5.94-.63-\
-.65-1.38-1.17-2.\
-21-1.54-.14-.06-\
-.23-.19-.26-.34l\
--.12-1.99c-.01-.\
-26-.09-.51-.22-.\
-74-1.72-2.2-3.28\
--4.52-4.65-6.96-\
-.08-.14-.19-.27-\
-.33-.38\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M31.5,\
-148.52c2.88,2.39\
-,6.33,4,10.02,4.\
-64,3.46.61,6.96.\
-92,10.47.94,13.2\
-8.06,26.57.07,39\
-.85.02,1.9,0,3.8\
--.18,5.67-.53,1.\
-62-.3,3.16-.96,4\
-.5-1.93\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M118.1\
-2,141.15l18.86-7\
-.04c1.25-.46,2.5\
-2-.86,3.81-1.19,\
-2.43-.61,4.91-1.\
-04,7.4-1.27,6.24\
--.59,12.51-.88,1\
-8.78-.88,26.02,0\
-,52.05-.09,78.08\
--.27,1.42,0,2.85\
-.04,4.26.13,2.1.\
-14,4.12.84,5.87,\
-2.02,4.11,2.8,8.\
-05,5.83,11.8,9.0\
-9,1.2,1.05,2.15,\
-2.36,2.77,3.83.5\
-4,1.27.86,2.62.9\
-5,3.99.12,1.45.1\
-6,2.91.14,4.37\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M118.22,145.96c\
-.47,2.31,1.18,4.\
-57,2.13,6.73.66,\
-1.5,1.52,2.9,2.5\
-6,4.16.77.94,1.6\
-2,1.81,2.54,2.61\
-,1.17,1.01,2.49,\
-1.82,3.93,2.4.96\
-.39,2,.5,3.02.33\
-.08-.01.13-.09.1\
-2-.16l-3.26-16.9\
-7c-.04-.2-.2-.36\
--.4-.39-.5-.09-1\
--.12-1.51-.11-2.\
-16.05-4.32.22-6.\
-47.52-.84.11-1.6\
-6.31-2.46.57-.14\
-.04-.22.18-.19.3\
-2\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M125.75,144.\
-6l-.4-1.94c-.04-\
-.21-.21-.36-.42-\
-.38h-7.27c-.21,0\
--.37.17-.37.37,0\
-,.02,0,.04,0,.07\
-.19,1.05.52,2.07\
-.97,3.04\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M125.\
-52,144.62l2.29,6\
-.5c1.32,3.75,2.7\
-7,7.46,4.35,11.1\
-1\x22/>\x0a        <li\
-ne class=\x22cls-1\x22\
- x1=\x22127.52\x22 y1=\
-\x22144.54\x22 x2=\x22131\
-.66\x22 y2=\x22161.07\x22\
-/>\x0a        <line\
- class=\x22cls-1\x22 x\
-1=\x22127.36\x22 y1=\x221\
-37.7\x22 x2=\x22125.86\
-\x22 y2=\x22144.6\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M3\
-55.5,135.54l-4.9\
-1,10.5c-.39.83-1\
-.18,1.41-2.09,1.\
-52-6.16.79-12.33\
-,1.54-18.5,2.24-\
-3.29.38-6.58.79-\
-9.86,1.24-1.07.1\
-5-2.14.32-3.21.5\
-3-.99.19-1.98.31\
--2.99.36-17.86.1\
-4-35.73.17-53.59\
-.08\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M248.49,15\
-1.93c-3.35-.03-6\
-.7-.06-10.05-.09\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M225.02,149.6\
-2c-10.98.15-21.9\
-6.26-32.93.35\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M176.94,150.07c-\
-15.57.09-31.14.1\
-1-46.71.07\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M11\
-9.35,150.13c-1,.\
-04-1.99.17-2.96.\
-38-2.81.59-5.65.\
-97-8.51,1.14-19.\
-5.34-39,.46-58.5\
-1.35-2.78-.02-5.\
-56-.22-8.31-.61-\
-2.93-.42-5.82-1.\
-13-8.61-2.12\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-41.06,151.39l.22\
-.55c.18.46.5.86.\
-91,1.15.21.14.44\
-.24.69.29\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M225\
-.02,149.62l1.23-\
-.02c1.04-.01,2.0\
-6.17,3.03.52,1.1\
-8.43,2.4.79,3.63\
-,1.06,1.82.39,3.\
-67.61,5.53.66\x22/>\
-\x0a        <line c\
-lass=\x22cls-1\x22 x1=\
-\x22232.38\x22 y1=\x22153\
-.04\x22 x2=\x22130.79\x22\
- y2=\x22153.04\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-20.52,153.04h-1.\
-2c-.83,0-1.66-.2\
-1-2.39-.6-.74-.4\
--1.38-.98-1.84-1\
-.67\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M232.38,15\
-3.04h4.06c.38,0,\
-.75-.04,1.12-.13\
-.59-.14,1.09-.53\
-,1.36-1.07\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M24\
-5.59,151.91c2.74\
-,1.12,5.66,1.74,\
-8.61,1.83,17.5.1\
-8,35,.39,52.49.6\
-1,1.57.02,3.14-.\
-19,4.64-.63,1.09\
--.32,2.16-.68,3.\
-23-1.07.57-.22,1\
-.11-.54,1.57-.94\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M362.7,81.31v\
-34.46c0,1.08-.1,\
-2.16-.3,3.23-2.1\
-8,8.49-5.27,16.7\
-3-9.21,24.56-.09\
-.17-.18.34-.27.5\
-1-.07.13-.19.24-\
-.33.3-.47.21-.96\
-.39-1.47.52\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M3\
-63.29,81.31v34.4\
-6c0,1.12-.11,2.2\
-5-.31,3.36-.79,3\
-.07-1.69,6.11-2.\
-71,9.11\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M364.3\
-9,81.31v33.24c0,\
-2.33-.23,4.66-.6\
-8,6.94-.28,1.41-\
-.6,2.81-.96,4.21\
--.03.12-.06.25-.\
-09.37-.03.11-.09\
-.21-.17.29-1.01.\
-88-2.04,1.74-3.0\
-9,2.58\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M333.7,\
-148.71c-1.31-.69\
--2.46-1.65-3.37-\
-2.82-.21-.27-.34\
--.6-.36-.95-.03-\
-.51-.02-1.02.04-\
-1.53.06-.55.53-.\
-96,1.08-.94.98.0\
-2,1.96.03,2.93.0\
-3.74,0,1.48-.05,\
-2.21-.15,2-.28,4\
--.65,5.96-1.11,1\
-.38-.32,2.64-1,3\
-.69-1.95,1.45-1.\
-32,2.8-2.73,4.07\
--4.23.46-.55,1.1\
-3-.88,1.86-.92.5\
-8-.03,1.17-.03,1\
-.75,0,.11,0,.21.\
-01.32.03,0,0,.02\
-,0,.03,0,.11.03.\
-17.14.14.25-1.29\
-,3.28-2.66,6.53-\
-4.11,9.74-.55,1.\
-22-1.74,2.02-3.0\
-7,2.08-5.03.22-1\
-0.06.46-15.08.74\
--.26.01-.51-.07-\
-.71-.23\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M333.7\
-,148.71l.67.32c.\
-25.12.53.18.8.16\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M321.68,81.31\
-v44.55c0,.6.11,1\
-.2.33,1.75.4,1.0\
-3,1.11,1.92,2.02\
-,2.54,1.16.78,2.\
-38,1.46,3.67,2,4\
-.36,1.85,8.59,3.\
-98,12.66,6.38,1.\
-09.65,2.07,1.44,\
-2.93,2.36\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M333\
-.86,145.1c4.15-.\
-07,8.3-.2,12.45-\
-.4,1.45-.07,2.72\
--1,3.24-2.35,1.0\
-4-2.71,2.02-5.46\
-,2.92-8.23\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M33\
-3.86,145.1h-.25c\
--.24,0-.48-.1-.6\
-3-.29-.11-.13-.1\
-7-.29-.18-.47-.0\
-1-.57,0-1.14.03-\
-1.71,0-.07.05-.1\
-2.12-.14\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M333.\
-25,145.03c.66.59\
-,1.38,1.11,2.12,\
-1.58.16.1.35.16.\
-54.16\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M343.97,\
-81.31v18.74c0,6.\
-24-.7,12.45-2.09\
-,18.54-.62,2.71-\
-1.51,5.36-2.66,7\
-.89-.44.97-1.21,\
-1.76-2.17,2.22-1\
-.11.45-2.25.82-3\
-.41,1.1-2.34.59-\
-4.68,1.22-7,1.89\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M342.62,81.31\
-v18.74c0,4.06-.3\
-,8.12-.9,12.13\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M352.21,81.31v1\
-6.65c0,9.57-.52,\
-19.14-1.56,28.66\
--.11.99-.4,1.94-\
-.87,2.81-.59,1.1\
--1.39,2.07-2.36,\
-2.87-.22.18-.52.\
-25-.8.18-3.36-1.\
-11-6.69-2.32-9.9\
-8-3.62\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M349.89\
-,81.31v16.65c0,9\
-.37-.5,18.73-1.5\
-,28.05\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M281.86\
-,130.14l30.14-.1\
-2c3.16-.01,6.29.\
-58,9.23,1.74,1.0\
-2.4,2.02.82,3.03\
-,1.25,3.06,1.31,\
-6.02,2.83,8.86,4\
-.55.37.22.7.49,1\
-,.79.03.03.05.06\
-.08.09.21.31.14.\
-75-.18.96-.36.25\
--.75.45-1.17.58-\
-3.92,1.28-8.01,2\
-.01-12.13,2.16-7\
-.88.29-15.76.4-2\
-3.64.33-2.33-.02\
--4.65-.36-6.89-1\
-.01-6.21-1.8-11.\
-99-4.82-17-8.89h\
-0c-.26-.23-.3-.6\
-2-.08-.88.18-.21\
-.38-.4.59-.57.29\
--.22.63-.37,1-.4\
-1,2.38-.31,4.77-\
-.5,7.16-.58\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M3\
-33.66,137.92c-4.\
-12,1.71-8.52,2.6\
-4-12.98,2.76-7.8\
-5.29-15.71.4-23.\
-57.33-2.2-.02-4.\
-39-.34-6.5-.95-6\
-.18-1.76-11.9-4.\
-84-16.77-9.03\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M320.27,139.8c-6\
-.9.21-13.8.29-20\
-.7.23-2.08-.02-4\
-.15-.32-6.15-.9-\
-4.52-1.29-8.79-3\
-.3-12.66-5.97\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M280.17,131.68c.\
-57-.03,1.15-.06,\
-1.72-.08l30.12-.\
-12c2.97-.01,5.92\
-.54,8.69,1.63.97\
-.36,1.93.78,2.86\
-,1.25\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M280.76,\
-133.18l-.3-.21c-\
-.25-.17-.46-.4-.\
-61-.66-.03-.05-.\
-05-.11-.05-.18-.\
-02-.23.15-.42.38\
--.44\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M323.56,1\
-34.36l.6.3c1.48.\
-75,2.95,1.54,4.3\
-8,2.38,0,0,.01,0\
-,.02,0,.31.2.41.\
-6.21.92-.14.24-.\
-36.43-.6.56-.21.\
-11-.43.19-.66.25\
--1.45.35-2.92.61\
--4.41.78-.94.11-\
-1.89.2-2.84.26\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M321.68,117.74h\
-16.36c.56,0,1.09\
--.25,1.45-.69,1.\
-15-1.41,1.92-3.0\
-8,2.24-4.87\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M3\
-38.04,117.74l-2.\
-32,6.56c-.2.58-.\
-16,1.22.12,1.77.\
-12.24.26.48.4.7.\
-37.59.78,1.16,1.\
-23,1.69\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M335.6\
-,125.2c-4.63.41-\
-9.26.8-13.89,1.1\
-6\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M108.82,138.\
-91c9.43-2.95,18.\
-82-6.02,28.16-9.\
-22.93-.32,1.89-.\
-52,2.87-.61,6.5-\
-.57,13.02-.91,19\
-.55-1.03,11.8-.2\
-,23.6-.29,35.4-.\
-26,38.56.09,77.1\
-2-.11,115.68-.62\
-,2.74-.03,5.48-.\
-09,8.21-.16,1.02\
--.03,2.05-.11,3.\
-06-.25\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M108.56\
-,137.85c9.45-2.7\
-8,18.83-5.8,28.1\
-3-9.04,1-.34,2.0\
-4-.56,3.08-.65,6\
-.52-.57,13.07-.9\
-2,19.61-1.03,11.\
-8-.2,23.61-.29,3\
-5.41-.26,38.55.0\
-9,77.11-.11,115.\
-67-.62,2.73-.04,\
-5.47-.09,8.2-.16\
-.99-.03,1.98-.11\
-,2.96-.25\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M200\
-.84,130.71c-.93,\
-3.43-1.97,6.83-3\
-.12,10.2-.26.75-\
-.44,1.52-.57,2.3\
--.17,1.1-.35,2.1\
-9-.53,3.29-.19,1\
-.12-.54,2.21-1.0\
-6,3.24-.05.09-.1\
-2.17-.2.23\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M91\
-.29,81.31v2.45c0\
-,8,.4,16,1.19,23\
-.96.82,8.23,2.98\
-,16.26,6.38,23.8\
-.73,1.62,1.63,3.\
-17,2.68,4.62.21.\
-29.45.56.71.81.3\
-6.34.85.5,1.34.4\
-3,2.79-.38,5.54-\
-.99,8.22-1.83,8.\
-28-2.58,16.54-5.\
-21,24.79-7.89\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M95.68,81.31v2.4\
-5c0,7.95.4,15.89\
-,1.19,23.8.81,8.\
-06,2.92,15.92,6.\
-25,23.3.57,1.27,\
-1.25,2.48,2.02,3\
-.63\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M106.7,135\
-.25c1.56-.32,3.1\
-1-.73,4.64-1.2,7\
-.95-2.48,15.89-5\
-,23.81-7.57\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-35.08,81.31v4.74\
-c0,4.87.14,9.73.\
-42,14.59.48,8.39\
-,1.1,16.77,1.84,\
-25.14.02.25.04.4\
-9.07.74.05.53-.3\
-,1.02-.81,1.15\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M133.49,81.31v4\
-.74c0,4.9.14,9.8\
-.42,14.68.49,8.3\
-9,1.1,16.77,1.84\
-,25.14\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M135.15\
-,126.47l.25-.08c\
-.22-.07.37-.29.3\
-6-.52\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M105.14,\
-134.5l.14.21c.31\
-.46.88.68,1.42.5\
-4\x22/>\x0a        <li\
-ne class=\x22cls-1\x22\
- x1=\x22199.66\x22 y1=\
-\x22120.02\x22 x2=\x22218\
-.31\x22 y2=\x22120.02\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M218.53,125.65\
-v-5.42c0-.12-.1-\
-.21-.21-.21\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-98.4,125.88v-4.5\
-1c0-.71.55-1.31,\
-1.26-1.36\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M217\
-.28,126.13h-18.6\
-4c-.13,0-.24-.11\
--.24-.25\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M217.\
-28,126.13h.75c.2\
-7,0,.49-.21.5-.4\
-8\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M218.53,124.\
-6h-12.97c-2.39,0\
--4.75.52-6.91,1.\
-53\x22/>\x0a        <l\
-ine class=\x22cls-1\
-\x22 x1=\x22318.77\x22 y1\
-=\x22119.3\x22 x2=\x22302\
-.5\x22 y2=\x22119.3\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M320.02,125.17v-\
-4.51c0-.71-.55-1\
-.3-1.26-1.35\x22/>\x0a\
-        <path cl\
-ass=\x22cls-1\x22 d=\x22M\
-303.35,125.41h16\
-.43c.13,0,.24-.1\
-1.24-.24h0\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M30\
-1.89,123.89h10.9\
-7c2.39,0,4.75.52\
-,6.91,1.53\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M30\
-1.88,119.55v4.18\
-c0,.14.04.28.11.\
-4.27.45.62.84,1.\
-03,1.16.09.07.21\
-.12.34.12\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M302\
-.5,119.3h-.38c-.\
-13,0-.24.1-.24.2\
-3v.02\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M198.4,1\
-24.25h-37.25c-6.\
-53,0-13.05.29-19\
-.55.86-1.43.12-2\
-.85.3-4.27.52\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M218.53,125.65c2\
-8.16.18,56.33.06\
-,84.49-.36\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M21\
-8.53,124.23c27.7\
-9.18,55.58.06,83\
-.37-.34\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M218.5\
-3,120.52c27.79.1\
-8,55.57.06,83.35\
--.34\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M118.12,1\
-41.15l-1.91.71c-\
-.8.3-1.56.71-2.2\
-6,1.21-.68.49-1.\
-23,1.15-1.6,1.9-\
-.29.58-.53,1.18-\
-.72,1.8-.14.43-.\
-3.86-.49,1.27-.4\
-8,1.08-.78,2.24-\
-.87,3.41\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M129.\
-11,144.8c47.2-.0\
-2,94.39-.24,141.\
-58-.62,4.6-.04,9\
-.2-.24,13.78-.62\
-,3.07-.25,6.12-.\
-7,9.14-1.34\x22/>\x0a \
-       <path cla\
-ss=\x22cls-1\x22 d=\x22M1\
-26.23,142.88c47.\
-11-.02,94.23-.22\
-,141.34-.6\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M11\
-7.82,144.71c-.1,\
-0-.21,0-.31,0-1.\
-52-.02-3.04-.29-\
-4.47-.79\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M85.8\
-5,81.31v5.56c0,6\
-.58.32,13.16.96,\
-19.7.36,3.71.92,\
-7.39,1.67,11.04,\
-1.29,6.24,3.81,1\
-2.14,7.42,17.38.\
-53.77,1.12,1.48,\
-1.77,2.13.72.73,\
-1.61,1.27,2.59,1\
-.58.78.25,1.57.4\
-3,2.38.54,2.06.2\
-9,4.16.17,6.18-.\
-34\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M86.93,81.3\
-1v5.56c0,6.54.32\
-,13.09.96,19.6.3\
-6,3.67.91,7.32,1\
-.66,10.93,1.26,6\
-.09,3.72,11.87,7\
-.25,16.98.49.71,\
-1.04,1.38,1.65,1\
-.98.6.6,1.34,1.0\
-5,2.15,1.31.72.2\
-3,1.45.39,2.2.5,\
-1.92.27,3.88.16,\
-5.76-.32\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M13.8\
-9,110.97c4.98,8.\
-31,10.87,16.04,1\
-7.57,23.05.95,1,\
-1.97,1.93,3.03,2\
-.8,1.07.86,2.31,\
-1.48,3.64,1.79,1\
-.49.36,3.01.59,4\
-.54.7,3.83.26,7.\
-68.39,11.52.4,13\
-.04,0,26.08.53,3\
-9.09,1.58,1.67.1\
-3,3.35.16,5.02.0\
-7,1.71-.09,3.4-.\
-31,5.08-.64,1.01\
--.2,1.94-.67,2.7\
-1-1.35\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M88.48,\
-117.61l-71.34-8.\
-03c-.41-.05-.83-\
-.03-1.23.06-.75.\
-15-1.43.51-1.98,\
-1.03-.08.08-.1.2\
--.04.3\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M13.85,\
-110.74l62.75,7.2\
-5c2.41.27,4.82.3\
-7,7.24.27,1.56-.\
-06,3.12-.28,4.64\
--.64\x22/>\x0a        \
-<line class=\x22cls\
--1\x22 x1=\x2241.83\x22 y\
-1=\x2281.31\x22 x2=\x2241\
-.83\x22 y2=\x2297.72\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M54.23,81.31v16\
-.6c0,.62-.14,1.2\
-3-.42,1.79-.82,1\
-.68-2.37,2.9-4.2\
-1,3.29-1.14.25-2\
-.32.25-3.46.01-2\
-.5-.52-4.3-2.73-\
-4.31-5.29\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M49.\
-23,81.31v14.97c0\
-,.39-.18.75-.49.\
-98-.93.69-2.03,1\
-.11-3.19,1.2\x22/>\x0a\
-        <line cl\
-ass=\x22cls-1\x22 x1=\x22\
-74.93\x22 y1=\x2281.31\
-\x22 x2=\x2274.93\x22 y2=\
-\x22101.03\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M49.6,\
-103l23.77-.37c.8\
-7-.01,1.57-.73,1\
-.56-1.6\x22/>\x0a     \
-   <line class=\x22\
-cls-1\x22 x1=\x2254.2\x22\
- y1=\x2298.38\x22 x2=\x22\
-74.48\x22 y2=\x22102.1\
-5\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M338.09,128.\
-01l9.85,3.65c.07\
-.02.14.02.2-.02\x22\
-/>\x0a        <line\
- class=\x22cls-1\x22 x\
-1=\x22340.22\x22 y1=\x221\
-24.08\x22 x2=\x22350.0\
-3\x22 y2=\x22127.71\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M350.03,127.71l.\
-27.1c.05.02.09.0\
-8.08.13\x22/>\x0a     \
-   <line class=\x22\
-cls-1\x22 x1=\x22340.5\
-8\x22 y1=\x22123.11\x22 x\
-2=\x22350.38\x22 y2=\x221\
-26.74\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M350.38,\
-126.74l.17.06s.0\
-6.05.06.09\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M34\
-9.45,81.31v12.65\
-c0,9.78-.49,19.5\
-5-1.47,29.27-.03\
-.27-.08.54-.16.8\
--.14.47-.62.75-1\
-.1.64-2.06-.47-4\
-.08-1.06-6.07-1.\
-79\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M355.5,135.\
-54l.1-.21c.06-.1\
-3.11-.26.16-.4.0\
-7-.22-.05-.46-.2\
-7-.53h-.03c-.46-\
-.13-.95-.17-1.43\
--.13\x22/>\x0a        \
-<line class=\x22cls\
--1\x22 x1=\x22357.36\x22 \
-y1=\x22134.33\x22 x2=\x22\
-355.63\x22 y2=\x22134.\
-47\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M10.34,112.\
-16c4.99,10.56,10\
-.6,20.82,16.79,3\
-0.74.25.4.54.77.\
-88,1.1.34.35.86.\
-46,1.32.28,2.55-\
-.98,5.12-1.91,7.\
-7-2.8\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M37.04,1\
-44.4l-5.54,2.36c\
--.32.14-.7.02-.8\
-9-.28-.45-.72-.8\
-3-1.47-1.16-2.25\
-\x22/>\x0a        <lin\
-e class=\x22cls-1\x22 \
-x1=\x228.9\x22 y1=\x22112\
-.94\x22 x2=\x2224.43\x22 \
-y2=\x22138.48\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M9.\
-76,81.31v3.88c0,\
-5.88.25,11.75.74\
-,17.61.26,3.1.38\
-,6.2.34,9.31,0,.\
-24,0,.47.03.71\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M4.92,115.96c1.\
-16,1.34,2.44,2.5\
-7,3.82,3.69\x22/>\x0a \
-       <line cla\
-ss=\x22cls-1\x22 x1=\x223\
-18.4\x22 y1=\x2281.55\x22\
- x2=\x22318.4\x22 y2=\x22\
-83.34\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M310.33,\
-81.31v.13c0,.26.\
-08.51.23.71.6.81\
-,1.54,1.31,2.55,\
-1.34h5.13c.09,0,\
-.16-.07.16-.15\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M318.4,81.55h-5\
-.85c-.13,0-.24-.\
-11-.25-.24\x22/>\x0a  \
-      <path clas\
-s=\x22cls-1\x22 d=\x22M31\
-8.4,81.55h.07c.1\
-3,0,.24-.11.24-.\
-24\x22/>\x0a        <p\
-ath class=\x22cls-1\
-\x22 d=\x22M137.41,126\
-.52l.09.62c.1.69\
-.3,1.36.6,1.98\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M138.1,129.12l.\
-07.14s0,0,0,0c.0\
-1.04,0,.08-.04.0\
-9\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M114.41,142.\
-76c-2.4-.44-4.54\
--1.78-5.97-3.77\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M2.44,81.31v4.\
-72c0,6.61.19,13.\
-21.57,19.81.08,1\
-.32.28,2.63.61,3\
-.91.36,1.39.95,2\
-.72,1.75,3.91\x22/>\
-\x0a        <path c\
-lass=\x22cls-1\x22 d=\x22\
-M11,116.41c-.22.\
-62-.34,1.27-.36,\
-1.93,0,.11,0,.23\
-,0,.34,0,.08.02.\
-16.05.22,5.01,8.\
-7,10.52,17.09,16\
-.49,25.15.31.41.\
-64.8,1.01,1.16.2\
-9.29.7.4,1.09.31\
-.23-.06.45-.12.6\
-7-.21\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M10.36,1\
-20.54l.14-1.5s0-\
-.04.01-.05c.03-.\
-07.12-.1.19-.07\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M10.36,120.54v\
-.14c-.02.06,0,.1\
-3.02.19.9,1.89,1\
-.9,3.73,2.99,5.5\
-2,2.72,4.45,5.6,\
-8.79,8.66,13.01,\
-1.49,2.06,3.1,4.\
-05,4.81,5.94.31.\
-34.63.68.97.99.2\
-1.19.42.38.63.57\
-.57.49,1.38.6,2.\
-07.29.33-.15.66-\
-.29,1-.42\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M96.\
-42,137.17c-4.18,\
-1.23-8.53,1.7-12\
-.88,1.39-11.13-.\
-79-22.28-1.13-33\
-.44-1.02-4.11.04\
--8.21,0-12.32-.1\
-3-2.18-.07-4.35-\
-.2-6.51-.39-.15-\
-.02-.3-.07-.43-.\
-15\x22/>\x0a        <l\
-ine class=\x22cls-1\
-\x22 x1=\x2296.42\x22 y1=\
-\x22137.17\x22 x2=\x2297.\
-41\x22 y2=\x22136.85\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M36.21,146.4c2.\
-98.69,5.92,1.58,\
-8.79,2.67,1.49.5\
-7,3.05.93,4.63,1\
-.1,10.69,1.13,21\
-.45,1.57,32.19,1\
-.29,5.65-.15,11.\
-29-.34,16.93-.57\
-,4.27-.18,8.47-1\
-.15,12.39-2.85\x22/\
->\x0a        <path \
-class=\x22cls-1\x22 d=\
-\x22M37.12,143.13c8\
-.38,1.23,16.8,2.\
-15,25.25,2.75,11\
-.88.84,23.78,1.4\
-6,35.69,1.85,4.4\
-.14,8.81.15,13.2\
-1.02\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M36.29,14\
-6.35l.18-.08c.59\
--.26,1.22-.42,1.\
-87-.48,6.11-.53,\
-12.26-.65,18.39-\
-.35\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M111.41,14\
-7.41c2.38,0,4.76\
-,0,7.14,0\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M129\
-.7,147.39c15.59-\
-.01,31.18-.01,46\
-.78,0\x22/>\x0a       \
- <path class=\x22cl\
-s-1\x22 d=\x22M191.16,\
-147.4c15.11.02,3\
-0.21.04,45.32.07\
-,3.31,0,6.61-.09\
-,9.91-.31\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M205\
-.39,130.7c-.23,4\
-.02-.7,8.02-1.39\
-,11.99\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M195.32\
-,130.73c-.85,2.9\
-8-2.02,5.87-3.47\
-,8.61-.61,1.15-1\
-.24,2.29-1.9,3.4\
-1\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M9.15,122.06\
-c-.05-.31,0-.63.\
-15-.91.05-.1.12-\
-.18.21-.24.12-.0\
-9.25-.16.38-.24.\
-14-.08.31-.1.47-\
-.06\x22/>\x0a        <\
-path class=\x22cls-\
-1\x22 d=\x22M5.55,81.3\
-1c0,2.92-.62,5.2\
-8-1.38,5.28s-1.3\
-8-2.37-1.38-5.28\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M4.02,86.56v2\
-.04c0,5.59.11,11\
-.17.33,16.75.07,\
-1.92.55,3.8,1.4,\
-5.51\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M246.44,1\
-49c-1.29.04-2.55\
-.4-3.66,1.05-.29\
-.17-.38.54-.21.8\
-3.07.12.19.22.32\
-.26.93.32,1.89.5\
-2,2.87.6,4.33.34\
-,8.67.51,13.01.5\
-2,1.11,0,2.19-.3\
-6,3.07-1.04.2-.1\
-5.32-.38.34-.63.\
-04-.5-.25-.96-.7\
--1.16-.39-.18-.8\
--.29-1.23-.34-.8\
-9-.11-1.78-.16-2\
-.67-.16-.2,0-.38\
-.1-.49.26-.2.3-.\
-37.6-.52.93-.11.\
-22-.32.38-.57.42\
--.42.06-.84.09-1\
-.26.09-2.28,0-4.\
-56-.03-6.84-.1-.\
-19,0-.36-.11-.46\
--.27-.18-.29-.34\
--.6-.48-.92-.09-\
-.21-.3-.34-.52-.\
-34\x22/>\x0a        <l\
-ine class=\x22cls-1\
-\x22 x1=\x22258.37\x22 y1\
-=\x22152.26\x22 x2=\x2225\
-8.38\x22 y2=\x22148.94\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M246.45,149c3\
-.7-.35,7.43-.38,\
-11.13-.07\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M177\
-.36,147.31c-1.29\
-.03-2.55.4-3.66,\
-1.06-.29.17-.39.\
-54-.21.83.07.12.\
-19.22.32.27.93.3\
-2,1.89.52,2.87.5\
-9,4.33.34,8.67.5\
-1,13.01.52,1.11,\
-0,2.19-.37,3.07-\
-1.04.2-.15.32-.3\
-8.34-.63.03-.5-.\
-25-.96-.7-1.16-.\
-39-.17-.8-.29-1.\
-23-.34-.89-.1-1.\
-78-.16-2.67-.16-\
-.2,0-.38.1-.49.2\
-7-.2.3-.37.6-.52\
-.93-.11.23-.32.3\
-8-.57.42-.42.06-\
-.84.09-1.26.09-2\
-.28,0-4.56-.03-6\
-.84-.11-.19,0-.3\
-6-.1-.46-.27-.18\
--.29-.34-.6-.48-\
-.92-.09-.21-.29-\
-.34-.52-.34\x22/>\x0a \
-       <line cla\
-ss=\x22cls-1\x22 x1=\x221\
-89.29\x22 y1=\x22150.5\
-7\x22 x2=\x22189.3\x22 y2\
-=\x22147.25\x22/>\x0a    \
-    <path class=\
-\x22cls-1\x22 d=\x22M177.\
-37,147.31c3.7-.3\
-5,7.43-.37,11.13\
--.07\x22/>\x0a        \
-<path class=\x22cls\
--1\x22 d=\x22M330.33,1\
-45.9c-3.85.11-7.\
-69.25-11.54.4-.7\
-2.03-1.41.26-2.0\
-1.66-1.34.92-2.8\
-2,1.61-4.38,2.04\
--4.8,1.33-9.75,2\
-.07-14.73,2.19-1\
-1.86.3-23.73.24-\
-35.59-.16\x22/>\x0a   \
-     <path class\
-=\x22cls-1\x22 d=\x22M242\
-.49,150.63h-.53c\
--2.41,0-4.79-.44\
--7.04-1.32-.09-.\
-04-.15-.11-.17-.\
-21-.03-.15.07-.3\
-.22-.32,3.78-.74\
-,7.59-1.25,11.43\
--1.54.02,0,.04-.\
-02.04-.05,0-.02-\
-.02-.04-.05-.04\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M317.96,146.42\
-c-3.95.22-7.92.1\
-4-11.86-.24\x22/>\x0a \
-       <line cla\
-ss=\x22cls-1\x22 x1=\x222\
-49.73\x22 y1=\x22142.4\
-1\x22 x2=\x22251.07\x22 y\
-2=\x22130.88\x22/>\x0a   \
-     <line class\
-=\x22cls-1\x22 x1=\x22251\
-.16\x22 y1=\x22142.4\x22 \
-x2=\x22252.45\x22 y2=\x22\
-131.27\x22/>\x0a      \
-  <path class=\x22c\
-ls-1\x22 d=\x22M357.36\
-,81.31v29.06c0,1\
-.24-.18,2.46-.53\
-,3.64-.78,2.64-1\
-.36,5.33-1.73,8.\
-06-.55,4.03-1.15\
-,8.05-1.8,12.06\x22\
-/>\x0a        <path\
- class=\x22cls-1\x22 d\
-=\x22M354.41,81.31v\
-2.04c0,.33.09.65\
-.26.93.43.73,1,1\
-.37,1.66,1.89.29\
-.23.65.34,1.02.3\
-3\x22/>\x0a        <pa\
-th class=\x22cls-1\x22\
- d=\x22M359.95,81.3\
-1v10.98c0,3.63-.\
-2,7.25-.59,10.86\
--1.14,10.42-2.6,\
-20.81-4.38,31.13\
-\x22/>\x0a        <pat\
-h class=\x22cls-1\x22 \
-d=\x22M361.29,81.31\
-v34.02c0,1.36-.1\
-4,2.73-.43,4.07-\
-.37,1.72-.84,3.4\
-1-1.4,5.08-.45,1\
-.34-1.79,2.16-3.\
-18,1.98\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M352.1\
-9,134.12l2.31-21\
-.28c.17-1.53.39-\
-3.05.65-4.56.17-\
-.97.68-1.85,1.44\
--2.47.21-.18.48-\
-.29.77-.32.57-.0\
-5,1.07-.39,1.35-\
-.89.34-.61.57-1.\
-27.7-1.95\x22/>\x0a   \
-     <line class\
-=\x22cls-1\x22 x1=\x22354\
-.99\x22 y1=\x22109.25\x22\
- x2=\x22354.99\x22 y2=\
-\x22122.84\x22/>\x0a     \
-   <path class=\x22\
-cls-1\x22 d=\x22M359.6\
-4,81.31c0,2.88-.\
-5,5.22-1.11,5.22\
-s-1.11-2.34-1.11\
--5.22\x22/>\x0a      <\
-/g>\x0a    </g>\x0a  <\
-/g>\x0a</svg>\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x06\x8a\x9c\xb3\
-\x00a\
-\x00s\x00s\x00e\x00t\x00s\
-\x00\x0e\
-\x03\xbf\xcc\x87\
-\x004\
-\x00r\x00u\x00n\x00n\x00e\x00r\x00-\x000\x002\x00.\x00s\x00v\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9ae\x99\x8b\xb2\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -1,15 +1,34 @@
 from __future__ import annotations
 import sys
 import glob
+import os
+import select
 import threading
 import time
+from typing import Callable
 import serial  # pyserial
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal, Slot, QThread, Qt
 import re
 import logging
 
 logger = logging.getLogger("control_head.serial_worker")
-logger.info("SerialWorker module loaded", extra={"origin": "serial_worker.module"})
+
+_ORIGIN_MODULE = {"origin": "serial_worker.module"}
+_ORIGIN_LOW_LATENCY = {"origin": "serial_worker._enable_low_latency"}
+_ORIGIN_READER = {"origin": "serial_worker._Reader.run"}
+_ORIGIN_INIT = {"origin": "serial_worker.__init__"}
+_ORIGIN_START = {"origin": "serial_worker.start"}
+_ORIGIN_STOP = {"origin": "serial_worker.stop"}
+_ORIGIN_ON_LINE = {"origin": "serial_worker._on_line"}
+
+logger.info("SerialWorker module loaded", extra=_ORIGIN_MODULE)
+
+# Match:
+#   1. state: PRESS or RELEASE
+#   2. name: anything (including spaces) up to the first key=value pair
+#      or end of line
+#   3. optional trailing " key=value" fields
+_BTN_RE = re.compile(r'(PRESS|RELEASE)\s+(.+?)(?:\s+\w+=\S+)*\s*\Z')
 
 def _default_port() -> str | None:
     # Linux (Pi): /dev/ttyACM* for Pico CDC (TinyUSB), sometimes ttyUSB*
@@ -17,93 +36,268 @@ def _default_port() -> str | None:
     return candidates[0] if candidates else None
 
 
+def _enable_low_latency(ser: serial.Serial) -> None:
+    # Ask the tty driver to push received bytes to us immediately instead of
+    # holding them for its flip-buffer timer (ASYNC_LOW_LATENCY). Not every
+    # driver supports TIOCSSERIAL, so this is best effort.
+    try:
+        ser.set_low_latency_mode(True)
+        logger.info("Enabled low-latency mode on serial port", extra=_ORIGIN_LOW_LATENCY)
+    except (AttributeError, ValueError, OSError) as e:
+        logger.debug("Low-latency mode unavailable: %s", e, extra=_ORIGIN_LOW_LATENCY)
+
+
+def _make_readinto(ser: serial.Serial) -> tuple[Callable[[memoryview], int], bool]:
+    """
+    Return (readinto, partial) for the reader loop: readinto(view) ->
+    bytes_read, and whether it returns whatever is available (True) rather
+    than blocking until `view` is full (False).
+
+    On POSIX this reads straight from the port's file descriptor (pyserial
+    has already set up termios and opened it non-blocking): one readiness
+    wait, then one os.readv() into the caller's buffer. That skips
+    pyserial's per-call timeout bookkeeping and the extra copy its
+    readinto() makes via read(). Elsewhere it falls back to ser.readinto.
+    """
+    if os.name != "posix":
+        return ser.readinto, False
+    try:
+        fd = ser.fileno()
+    except (AttributeError, OSError, ValueError, serial.SerialException):
+        # e.g. io.UnsupportedOperation from a backend without a real fd
+        return ser.readinto, False
+    timeout = ser.timeout
+
+    if sys.platform.startswith("linux"):
+        # Register the fd once; poll() then doesn't rebuild an fd_set per call.
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        timeout_ms = None if timeout is None else int(timeout * 1000)
+
+        def wait() -> bool:
+            return bool(poller.poll(timeout_ms))
+    else:
+        # macOS poll() doesn't support tty devices
+        def wait() -> bool:
+            return bool(select.select([fd], [], [], timeout)[0])
+
+    def readinto(view: memoryview) -> int:
+        if not wait():
+            return 0
+        try:
+            n = os.readv(fd, [view])
+        except BlockingIOError:
+            return 0
+        if not n:
+            # Readable but empty means the device went away (USB unplug);
+            # pyserial raises in the same situation.
+            raise serial.SerialException("device reports readiness to read but returned no data")
+        return n
+
+    return readinto, True
+
+
+# Lines read close together are handed to the GUI thread as one batch so a
+# burst of button edges costs one cross-thread post instead of one per line.
+_BATCH_WINDOW_S = 0.004
+_BATCH_MAX_LINES = 32
+
+_READ_SIZE = 4096
+
+# RX lines are debug chatter (buttonEvent is the event of record); cap how
+# many get logged per second so a button mash can't flood the log.
+_LOG_BUDGET_PER_S = 20
+
+# A repeat of the same (name, pressed) edge this soon after the last one is
+# switch bounce / a duplicated line, not a new event.
+_DEDUP_WINDOW_S = 0.010
+
+# Back-off after a failed read (e.g. Pico unplugged) before retrying.
+_READ_ERROR_SLEEP_S = 0.5
+
+
+class _LineFramer:
+    """
+    Splits the raw serial byte stream into text lines.
+
+    All complete lines in a read are decoded and split in one go straight
+    out of the caller's read buffer, so the byte scanning stays in C
+    (rfind/decode/split) rather than a per-line Python loop. Only a partial
+    line left at the end of a read is copied (into a small carry-over
+    bytearray) until its newline arrives.
+    """
+
+    def __init__(self):
+        self._tail = bytearray()
+
+    def feed(self, buf: bytearray, n: int) -> list[str]:
+        view = memoryview(buf)
+        tail = self._tail
+        end = buf.rfind(b"\n", 0, n)
+        if end == -1:
+            tail += view[:n]
+            return []
+        if tail:
+            tail += view[:end]
+            text = tail.decode(errors="ignore")
+            tail.clear()
+        else:
+            text = str(view[:end], "utf-8", "ignore")
+        tail += view[end + 1:n]
+        return [line.strip() for line in text.split("\n")]
+
+
 class _Reader(QObject):
-    lineRead = Signal(str)
+    linesRead = Signal(list)  # list[str]
 
     def __init__(self, ser: serial.Serial):
         super().__init__()
         self._ser = ser
         self._stop = False
+        self._buf = bytearray(_READ_SIZE)
+        self._mv = memoryview(self._buf)
+        self._framer = _LineFramer()
 
     def stop(self):
         self._stop = True
 
     def run(self):
-        buf = bytearray()
+        ser = self._ser
+        buf = self._buf
+        mv = self._mv
+        framer = self._framer
+        readinto, partial = _make_readinto(ser)
+        pending: list[str] = []
+        first_pending = 0.0
+        waiting = 0
+        failing = False
         while not self._stop:
             try:
-                b = self._ser.read(1)
-                if not b:
-                    continue
-                if b == b"\n":
-                    try:
-                        self.lineRead.emit(buf.decode(errors="ignore").strip())
-                    finally:
-                        buf.clear()
-                else:
-                    buf.extend(b)
-            except Exception:
-                time.sleep(0.1)
+                # The fd path returns whatever is available, so hand it the
+                # whole buffer: a burst is one read. ser.readinto blocks
+                # until the view is full, so size it to one byte (wait up to
+                # the port timeout) or to what the driver already had
+                # buffered last time we asked.
+                n = readinto(mv if partial else mv[:min(max(waiting, 1), _READ_SIZE)])
+                failing = False
+                if n:
+                    lines = framer.feed(buf, n)
+                    if lines:
+                        if not pending:
+                            first_pending = time.monotonic()
+                        pending.extend(lines)
+
+                # One in_waiting ioctl per read, shared by the flush check
+                # below and (fallback path) the size of the next read.
+                waiting = ser.in_waiting
+
+                # Flush once the port is drained, the batch is full, or the
+                # oldest pending line has waited a full window.
+                if pending and (
+                    not waiting
+                    or len(pending) >= _BATCH_MAX_LINES
+                    or time.monotonic() - first_pending >= _BATCH_WINDOW_S
+                ):
+                    self.linesRead.emit(pending)
+                    pending = []
+            except Exception as e:
+                # Only log the first error of a run; a dead port would
+                # otherwise log on every retry.
+                if not failing:
+                    failing = True
+                    logger.debug("Serial read failed: %s", e, extra=_ORIGIN_READER)
+                time.sleep(_READ_ERROR_SLEEP_S)
 
 
 class SerialWorker(QObject):
     buttonEvent = Signal(str, bool)  # (name, pressed)
+    buttonEvents = Signal(list)  # list[(name, pressed)], one per reader batch
 
     def __init__(self, port: str | None, baud: int = 115200):
         super().__init__()
         self._port = port or _default_port()
         if not self._port:
-            logger.warning("No serial device found. Plug in the Pico.", extra={"origin": "serial_worker.__init__"})
+            logger.warning("No serial device found. Plug in the Pico.", extra=_ORIGIN_INIT)
         self._baud = baud
         self._thread = QThread()
         self._reader: _Reader | None = None
+        self._log_window_start = 0.0
+        self._log_budget = _LOG_BUDGET_PER_S
+        self._last_state: dict[str, tuple[bool, float]] = {}  # name -> (pressed, monotonic time)
 
     def start(self):
         if not self._port:
             return
         try:
             ser = serial.Serial(self._port, self._baud, timeout=0.1)
-            logger.info(f"Opened serial port {self._port} at {self._baud} baud", extra={"origin": "serial_worker.start"})
+            logger.info("Opened serial port %s at %s baud", self._port, self._baud, extra=_ORIGIN_START)
         except Exception as e:
-            logger.error(f"Failed to open {self._port}: {e}", extra={"origin": "serial_worker.start"})
+            logger.error("Failed to open %s: %s", self._port, e, extra=_ORIGIN_START)
             return
+        if sys.platform.startswith("linux"):
+            _enable_low_latency(ser)
         self._reader = _Reader(ser)
         self._reader.moveToThread(self._thread)
         self._thread.started.connect(self._reader.run)
-        self._reader.lineRead.connect(self._on_line)
+        # linesRead is emitted from the reader thread; always hop to ours.
+        self._reader.linesRead.connect(self._on_lines, Qt.QueuedConnection)
         self._thread.start()
 
     def stop(self):
-        logger.info("Stopping SerialWorker", extra={"origin": "serial_worker.stop"})
+        logger.info("Stopping SerialWorker", extra=_ORIGIN_STOP)
         if self._reader:
             self._reader.stop()
         if self._thread.isRunning():
             self._thread.quit()
             self._thread.wait(1000)
 
+    @Slot(list)
+    def _on_lines(self, lines: list):
+        events = []
+        for line in lines:
+            event = self._on_line(line)
+            if event is not None:
+                events.append(event)
+        if events:
+            self.buttonEvents.emit(events)
 
-    def _on_line(self, line: str):
+    def _on_line(self, line: str) -> tuple[str, bool] | None:
         line = line.strip()
 
-        # Match:
-        #   1. state: PRESS or RELEASE
-        #   2. name: anything (including spaces) up to the first key=value pair
-        #      or end of line
-        #   3. optional trailing " key=value" fields
-        m = re.match(r'^(PRESS|RELEASE)\s+(.+?)(?:\s+\w+=\S+)*\s*$', line)
-        if m:
+        # Fast path for the plain "PRESS <name>" / "RELEASE <name>" form;
+        # the regex is only needed when key=value fields may follow.
+        state, _, rest = line.partition(" ")
+        if (state == "PRESS" or state == "RELEASE") and rest and "=" not in rest:
+            name = rest.strip()
+        else:
+            m = _BTN_RE.match(line)
+            if m is None:
+                # Fallback / unhandled lines
+                if logger.isEnabledFor(logging.DEBUG) and self._log_allowed():
+                    logger.debug("RX (unhandled): %s", line, extra=_ORIGIN_ON_LINE)
+                return None
             state = m.group(1)
             name = m.group(2)
-            pressed = (state == "PRESS")
-            logger.info(
-                f"Button {name} is {state}",
-                extra={"origin": "serial_worker._on_line"}
-            )
-            self.buttonEvent.emit(name, pressed)
-            return
 
-        # Fallback / unhandled lines
-        logger.info(
-            f"RX (unhandled): {line}",
-            extra={"origin": "serial_worker._on_line"}
-        )
+        pressed = (state == "PRESS")
+        now = time.monotonic()
+        prev = self._last_state.get(name)
+        if prev is not None and prev[0] == pressed and now - prev[1] < _DEDUP_WINDOW_S:
+            return None
+        self._last_state[name] = (pressed, now)
+
+        if logger.isEnabledFor(logging.DEBUG) and self._log_allowed():
+            logger.debug("Button %s is %s", name, state, extra=_ORIGIN_ON_LINE)
+        self.buttonEvent.emit(name, pressed)
+        return name, pressed
+
+    def _log_allowed(self) -> bool:
+        # Fixed one-second window: up to _LOG_BUDGET_PER_S RX log lines each.
+        now = time.monotonic()
+        if now - self._log_window_start >= 1.0:
+            self._log_window_start = now
+            self._log_budget = _LOG_BUDGET_PER_S
+        if self._log_budget:
+            self._log_budget -= 1
+            return True
+        return False
@@ -2,31 +2,75 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Dict, List, Iterable, Optional
+from enum import IntEnum
+from typing import Callable, Dict, List, Iterable, Optional, Tuple
 import logging
+import time
+import weakref
 
-from pcm import PCMManager, ChannelState, ChannelHealth, PCMChannel  # adjust import as needed
+from pcm import PCMDevice, ChannelState, PCMChannel  # adjust import as needed
 
 logger = logging.getLogger("control_head.switches")
 
+_ORIGIN_INIT = {"origin": "switches.LogicalSwitch.__init__"}
+_ORIGIN_ON = {"origin": "switches.LogicalSwitch.on"}
+_ORIGIN_OFF = {"origin": "switches.LogicalSwitch.off"}
+_ORIGIN_PRESS = {"origin": "switches.LogicalSwitch.press"}
+_ORIGIN_RELEASE = {"origin": "switches.LogicalSwitch.release"}
+_ORIGIN_CYCLE = {"origin": "switches.LogicalSwitch.cycle"}
+
 
 # ---------- Models ----------
-class SwitchState(Enum):
-    UNKNOWN = auto()
-    OFF = auto()
-    ON = auto()
-    PARTIAL = auto()
-    FAULT = auto()
+class SwitchState(IntEnum):
+    UNKNOWN = 0
+    OFF = 1
+    ON = 2
+    PARTIAL = 3
+    FAULT = 4
     
-class SwitchType(Enum):
-    TOGGLE = auto()
-    MOMENTARY = auto()
-    CYCLE = auto()
+class SwitchType(IntEnum):
+    TOGGLE = 0
+    MOMENTARY = 1
+    CYCLE = 2
 
 # ---------- Logical Switch ----------
+def _noop(_switch: LogicalSwitch) -> None:
+    pass
+
+
+def _group_by_pcm(channels: Iterable[PCMChannel]) -> List[Tuple[PCMDevice, int, Tuple[int, ...]]]:
+    """
+    Group channels by their PCM as (pcm, channel bitmask, indices), in
+    first-seen order, so callers can act on a whole PCM's worth of channels
+    with one mask op / one set_channels_mask command.
+    """
+    groups: Dict[int, Tuple[PCMDevice, int, List[int]]] = {}
+    for ch in channels:
+        pcm, mask, idx = groups.get(id(ch.pcm), (ch.pcm, 0, []))
+        idx.append(ch.index)
+        groups[id(ch.pcm)] = (pcm, mask | (1 << ch.index), idx)
+    return [(pcm, mask, tuple(idx)) for pcm, mask, idx in groups.values()]
+
+
 class LogicalSwitch:
+    __slots__ = (
+        "name",
+        "channels",
+        "type",
+        "cycles",
+        "_cycle_index",
+        "_on_press",
+        "_on_release",
+        "_groups",
+        "_cycle_plan",
+        "_n_cycles",
+        "_state_key",
+        "_state",
+        "_listeners",
+        "_notified_state",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         name: str,
@@ -40,93 +84,162 @@ class LogicalSwitch:
         # For CYCLE behavior
         self.cycles: List[List[PCMChannel]] = cycles or []
         self._cycle_index: int = 0  # index into self._cycles
+        # Called (no args) after every on/off/cycle command and whenever the
+        # switch's reported state (get_state()) changes
+        self._listeners: List[weakref.WeakMethod] = []
+
+        self.invalidate()
 
         logger.info(
-            f"LogicalSwitch created: {self.name} with {len(channels)} channels "
-            f"(type={self.type}, cycles={len(self.cycles)})",
-            extra={"origin": "switches.LogicalSwitch.__init__"},
+            "LogicalSwitch created: %s with %d channels (type=%s, cycles=%d)",
+            self.name,
+            len(channels),
+            self.type.name,
+            len(self.cycles),
+            extra=_ORIGIN_INIT,
+        )
+
+    def invalidate(self) -> None:
+        """
+        Rebuild the press/release handlers and per-PCM plans derived from
+        self.type, self.channels and self.cycles (used by press/release/
+        on/off/cycle/get_state). Call after changing any of them.
+        """
+        # press: TOGGLE toggles, MOMENTARY turns on, CYCLE advances a step.
+        # release: only MOMENTARY acts (turns off).
+        # Plain functions, not bound methods, so the switch doesn't hold a
+        # reference cycle to itself and is freed by refcounting alone.
+        self._on_press: Callable[[LogicalSwitch], None] = {
+            SwitchType.TOGGLE: LogicalSwitch.toggle,
+            SwitchType.MOMENTARY: LogicalSwitch.on,
+            SwitchType.CYCLE: LogicalSwitch.cycle,
+        }[self.type]
+        self._on_release: Callable[[LogicalSwitch], None] = (
+            LogicalSwitch.off if self.type is SwitchType.MOMENTARY else _noop
         )
 
+        for pcm, _, _ in getattr(self, "_groups", ()):
+            pcm.remove_listener(self._on_pcm_state_changed)
+        self._groups = _group_by_pcm(self.channels)
+        for pcm, _, _ in self._groups:
+            pcm.add_listener(self._on_pcm_state_changed)
+
+        # Per cycle step: (pcm, on_mask, off_mask) turning the step's
+        # channels on and the switch's other channels off.
+        all_masks = {id(pcm): mask for pcm, mask, _ in self._groups}
+        self._cycle_plan: List[List[Tuple[PCMDevice, int, int]]] = []
+        for step in self.cycles:
+            plan = {id(pcm): (pcm, 0, mask) for pcm, mask, _ in self._groups}
+            for pcm, on_mask, _ in _group_by_pcm(step):
+                plan[id(pcm)] = (pcm, on_mask, all_masks.get(id(pcm), 0) & ~on_mask)
+            self._cycle_plan.append([entry for entry in plan.values() if entry[1] or entry[2]])
+        self._n_cycles = len(self.cycles)
+        # get_state() result, valid while every group's PCM epoch is unchanged
+        self._state_key: Optional[tuple] = None
+        self._state: SwitchState = SwitchState.UNKNOWN
+        self._notified_state: SwitchState = self.get_state()
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to run after this switch is commanded
+        on/off/cycled and when its reported state changes. `callback` must
+        be a bound method; it is held weakly (as in PCMDevice.add_listener)
+        so a listener such as a Button isn't kept alive by its switch.
+        """
+        self._listeners.append(weakref.WeakMethod(callback))
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, callback)]
+
+    def _notify_listeners(self) -> None:
+        dead = False
+        for ref in self._listeners:
+            callback = ref()
+            if callback is None:
+                dead = True
+            else:
+                callback()
+        if dead:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+
+    def _on_pcm_state_changed(self) -> None:
+        # A bound PCM reported new state; only tell listeners if it changed
+        # what this switch looks like.
+        state = self.get_state()
+        if state != self._notified_state:
+            self._notified_state = state
+            self._notify_listeners()
+
     # ----- Public API -----
 
     def on(self) -> None:
         """
         Turn ALL bound channels ON (as a command).
         """
-        logger.info(f"Turning ON LogicalSwitch: {self.name}", extra={"origin": "switches.LogicalSwitch.on"})
-        for ch in self.channels:
-            ch.on()
+        logger.debug("Turning ON LogicalSwitch: %s", self.name, extra=_ORIGIN_ON)
+        # One mask command per PCM rather than one per channel
+        for pcm, mask, _ in self._groups:
+            pcm.set_channels_mask(mask, 0)
+        self._notify_listeners()
 
     def off(self) -> None:
         """
         Turn ALL bound channels OFF (as a command).
         """
-        logger.info(f"Turning OFF LogicalSwitch: {self.name}", extra={"origin": "switches.LogicalSwitch.off"})
-        for ch in self.channels:
-            ch.off()
+        logger.debug("Turning OFF LogicalSwitch: %s", self.name, extra=_ORIGIN_OFF)
+        for pcm, mask, _ in self._groups:
+            pcm.set_channels_mask(0, mask)
+        self._notify_listeners()
             
     def press(self) -> None:
         """
         Helper function for when a key is pressed on the physical keypad. Varies by switch config.
         """
-        logger.info(f"Pressing LogicalSwitch: {self.name}", extra={"origin": "switches.LogicalSwitch.press"})
-        # For now, just toggle. Could be extended for momentary, etc.
-        
-        match self.type:
-            case SwitchType.TOGGLE:
-                self.toggle()
-            case SwitchType.MOMENTARY:
-                self.on()
-            case SwitchType.CYCLE:
-                self.cycle()
+        logger.debug("Pressing LogicalSwitch: %s", self.name, extra=_ORIGIN_PRESS)
+        self._on_press(self)
+
     def release(self) -> None:
         """
         Helper function for when a key is released on the physical keypad. Varies by switch config.
         """
-        logger.info(f"Releasing LogicalSwitch: {self.name}", extra={"origin": "switches.LogicalSwitch.release"})
-        match self.type:
-            case SwitchType.MOMENTARY:
-                self.off()
-            case _:
-                pass  # No action for TOGGLE or CYCLE on release
+        logger.debug("Releasing LogicalSwitch: %s", self.name, extra=_ORIGIN_RELEASE)
+        self._on_release(self)
 
     def toggle(self) -> None:
         # TODO: you can base this on get_state()
         if self.type is SwitchType.CYCLE and self.cycles:
             self.cycle()
+        # simple toggle on commanded state: if anything is on -> off, else -> on
+        elif self.is_requested_on():
+            self.off()
         else:
-            # simple toggle: if "mostly off" -> on, else -> off
-            if self.is_on():
-                self.off()
-            else:
-                self.on()
-    
+            self.on()
+
     def cycle(self) -> None:
         """Advance to next step in cycles array."""
         if not self.cycles:
             logger.warning(
-                f"LogicalSwitch {self.name} has no cycles defined; cannot cycle",   
-                extra={"origin": "switches.LogicalSwitch.cycle"},
+                "LogicalSwitch %s has no cycles defined; cannot cycle",
+                self.name,
+                extra=_ORIGIN_CYCLE,
             )
             return
 
-        self._cycle_index = (self._cycle_index + 1) % len(self.cycles)
-        step = self.cycles[self._cycle_index]
-        logger.info(
-            f"Cycling LogicalSwitch {self.name} to step {self._cycle_index}",
-            extra={"origin": "switches.LogicalSwitch.cycle"},
+        self._cycle_index = (self._cycle_index + 1) % self._n_cycles
+        logger.debug(
+            "Cycling LogicalSwitch %s to step %d",
+            self.name,
+            self._cycle_index,
+            extra=_ORIGIN_CYCLE,
         )
-        # selected on
-        for ch in step:
-            ch.on()
-        # non-selected off
-        other_channels = set(self.channels) - set(step)
-        for ch in other_channels:
-            ch.off()
+        # selected on, non-selected off: one mask command per PCM
+        for pcm, on_mask, off_mask in self._cycle_plan[self._cycle_index]:
+            pcm.set_channels_mask(on_mask, off_mask)
+        self._notify_listeners()
 
     def get_state(self) -> SwitchState:
         """
-        Derive current state from the underlying ChannelState objects.
+        Derive current state from the bound channels on each PCM.
 
         Rules:
         - If any channel has fault -> FAULT.
@@ -134,49 +247,106 @@ class LogicalSwitch:
         - Else if all on -> ON.
         - Else -> PARTIAL.
         """
-        states = list(self.iter_channel_states())
-        if not states:
+        key = tuple([pcm.epoch for pcm, _, _ in self._groups])
+        if key == self._state_key:
+            return self._state
+        state = self._compute_state()
+        self._state_key = key
+        self._state = state
+        return state
+
+    def _compute_state(self) -> SwitchState:
+        if not self._groups:
             return SwitchState.UNKNOWN
 
-        # Fault overrides everything
-        for st in states:
-            if st.health in (ChannelHealth.SHORT, ChannelHealth.OPEN):
+        # One pass over the PCM groups, all mask ops; fault overrides everything
+        any_on = False
+        all_on = True
+        for pcm, mask, _ in self._groups:
+            if pcm.fault_mask & mask:
                 return SwitchState.FAULT
+            on = pcm.actual_mask & mask
+            any_on = any_on or on != 0
+            all_on = all_on and on == mask
 
-        ons = [st.actual_on for st in states]
-        if all(not v for v in ons):
+        if not any_on:
             return SwitchState.OFF
-        if all(ons):
+        if all_on:
             return SwitchState.ON
         return SwitchState.PARTIAL
 
+    def is_requested_on(self) -> bool:
+        # Any bound channel commanded ON (what we asked for, not yet confirmed)
+        for pcm, mask, _ in self._groups:
+            if pcm.requested_mask & mask:
+                return True
+        return False
+
     def is_on(self) -> bool:
-        states = [ch.state() for ch in self.channels]
-        return any(s.actual_on for s in states)
+        # Any bound channel reported ON; one mask test per PCM, stops at the first hit
+        for pcm, mask, _ in self._groups:
+            if pcm.actual_mask & mask:
+                return True
+        return False
 
     def iter_channel_states(self) -> Iterable[ChannelState]:
         """
-        Convenience for UI / diagnostics: yield ChannelState for each binding.
+        Convenience for UI / diagnostics: yield ChannelState for each bound channel.
+        Channels hold their PCMDevice directly, so there is no manager lookup.
         """
-        for b in self._bindings:
-            pcm = self._pcm.get_pcm(b.node_id)
-            if pcm is None:
-                continue
-            yield pcm.get_channel_state(b.channel_index)
+        for ch in self.channels:
+            yield ch.to_state()
 
     def __repr__(self) -> str:
-        return f"<LogicalSwitch name={self.name!r} bindings={len(self._bindings)}>"
+        return f"<LogicalSwitch name={self.name!r} channels={len(self.channels)}>"
 
 
 # ---------- Switch Manager ----------
 class SwitchManager:
     def __init__(self):
         self._switches: dict[str, LogicalSwitch] = {}
+        # name -> bound method, kept in step with _switches by add/remove
+        self._on_dispatch: dict[str, Callable[[], None]] = {}
+        self._off_dispatch: dict[str, Callable[[], None]] = {}
+        self._toggle_dispatch: dict[str, Callable[[], None]] = {}
 
     def add(self, switch: LogicalSwitch) -> LogicalSwitch:
-        self._switches[switch.name] = switch
+        name = switch.name
+        self._switches[name] = switch
+        self._on_dispatch[name] = switch.on
+        self._off_dispatch[name] = switch.off
+        self._toggle_dispatch[name] = switch.toggle
         return switch
 
+    def remove(self, name: str) -> Optional[LogicalSwitch]:
+        self._on_dispatch.pop(name, None)
+        self._off_dispatch.pop(name, None)
+        self._toggle_dispatch.pop(name, None)
+        return self._switches.pop(name, None)
+
+    # Name-based control; each returns False if no such switch.
+
+    def set_switch_on(self, name: str) -> bool:
+        fn = self._on_dispatch.get(name)
+        if fn is None:
+            return False
+        fn()
+        return True
+
+    def set_switch_off(self, name: str) -> bool:
+        fn = self._off_dispatch.get(name)
+        if fn is None:
+            return False
+        fn()
+        return True
+
+    def toggle_switch(self, name: str) -> bool:
+        fn = self._toggle_dispatch.get(name)
+        if fn is None:
+            return False
+        fn()
+        return True
+
     def get(self, name: str) -> Optional[LogicalSwitch]:
         return self._switches.get(name)
 
@@ -184,36 +354,75 @@ class SwitchManager:
     def __iter__(self):
         return iter(self._switches.values())
 
+    def items(self):
+        return self._switches.items()
 
-class ButtonLEDMode(Enum):
-    STATIC = auto()
-    FOLLOW_SWITCH_STATE = auto()
-    FOLLOW_CYCLE_STEP = auto()
-    BLINK = auto()
+
+class ButtonLEDMode(IntEnum):
+    STATIC = 0
+    FOLLOW_SWITCH_STATE = 1
+    FOLLOW_CYCLE_STEP = 2
+    BLINK = 3
     # etc.
 
 
 class Button:
-    def __init__(self, id: int, label: str = ""):
+    __slots__ = ("id", "label", "_bound_switch_ref", "led_mode", "color", "debounce_ns", "_last_press_ns", "__weakref__")
+
+    # Presses closer together than this are contact bounce, not new presses
+    DEBOUNCE_NS = 20_000_000
+
+    def __init__(self, id: int, label: str = "", debounce_ns: int = DEBOUNCE_NS):
         self.id = id
         self.label = label or f"BTN{id}"
-        self.bound_switch: LogicalSwitch | None = None
+        # Weak so a switch holding this button's LED listener doesn't form a cycle
+        self._bound_switch_ref: weakref.ref[LogicalSwitch] | None = None
         self.led_mode: ButtonLEDMode = ButtonLEDMode.FOLLOW_SWITCH_STATE
         # some representation of color, flashing pattern, etc.
         self.color = (0, 0, 0)
+        self.debounce_ns = debounce_ns
+        self._last_press_ns: int = 0
+
+    @property
+    def bound_switch(self) -> LogicalSwitch | None:
+        ref = self._bound_switch_ref
+        return ref() if ref is not None else None
+
+    @bound_switch.setter
+    def bound_switch(self, switch: LogicalSwitch | None) -> None:
+        self._bound_switch_ref = weakref.ref(switch) if switch is not None else None
+
+    def bind(self, switch: LogicalSwitch | None) -> None:
+        """
+        Bind this button to `switch` (or unbind with None). The LED is
+        refreshed whenever the switch is commanded, instead of being polled.
+        """
+        old = self.bound_switch
+        if old is not None:
+            old.remove_listener(self.update_led_for_switch_state)
+        self.bound_switch = switch
+        if switch is not None:
+            switch.add_listener(self.update_led_for_switch_state)
+        self.update_led_for_switch_state()
 
     def on_press(self):
         """Called when the *hardware* tells us this button was pressed."""
-        if self.bound_switch:
-            self.bound_switch.toggle()
+        now = time.monotonic_ns()
+        if now - self._last_press_ns < self.debounce_ns:
+            return
+        self._last_press_ns = now
+        sw = self.bound_switch
+        if sw is not None:
+            sw.toggle()
 
     def update_led_for_switch_state(self):
         """Update color/flashing based on bound switch state."""
-        if not self.bound_switch:
+        sw = self.bound_switch
+        if sw is None:
             self.color = (0, 0, 0)
             return
 
-        state = self.bound_switch.is_on()
+        state = sw.is_on()
         # Example simple rule:
         # - off -> dim white
         # - on -> bright green
@@ -0,0 +1,22 @@
+# test_imports.py
+# Import smoke test for the Qt-free modules in src/. Also guards against the
+# stale duplicate of resources_rc.py creeping back into src/.
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+
+def test_core_modules_import():
+    for name in ("pcm", "switches", "patterns", "effects"):
+        importlib.import_module(name)
+
+
+def test_single_resources_rc():
+    assert not (SRC / "resources_rc.py").exists()
+    assert (SRC.parent / "resources_rc.py").exists()